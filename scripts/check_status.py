@@ -153,16 +153,20 @@ def check_database():
         
         try:
             client = SQLiteClient(str(db_path))
-            with client.get_connection() as conn:
-                cursor = conn.execute('SELECT COUNT(*) FROM raw_traces')
-                total = cursor.fetchone()[0]
-                print(f"   Total events: {total}")
-                
+            with client.get_connection(read_only=True) as conn:
+                # Single scan for all summary counts
                 cursor = conn.execute('''
-                    SELECT COUNT(*) FROM raw_traces 
-                    WHERE timestamp > datetime('now', '-1 hour')
+                    SELECT
+                        COUNT(*),
+                        SUM(CASE WHEN timestamp > datetime('now', '-1 hour') THEN 1 ELSE 0 END),
+                        SUM(CASE WHEN model IS NOT NULL THEN 1 ELSE 0 END),
+                        SUM(CASE WHEN event_type = 'database_trace' THEN 1 ELSE 0 END)
+                    FROM raw_traces
                 ''')
-                recent = cursor.fetchone()[0]
+                total, recent, with_model, db_traces = (
+                    value or 0 for value in cursor.fetchone()
+                )
+                print(f"   Total events: {total}")
                 print(f"   Events (last hour): {recent}")
                 
                 cursor = conn.execute('''
@@ -173,18 +177,14 @@ def check_database():
                     LIMIT 10
                 ''')
                 print("   Event breakdown:")
-                for row in cursor.fetchall():
-                    print(f"     - {row[0]}: {row[1]}")
+                for event_type, cnt in cursor:
+                    print(f"     - {event_type}: {cnt}")
                 
-                cursor = conn.execute('SELECT COUNT(*) FROM raw_traces WHERE model IS NOT NULL')
-                with_model = cursor.fetchone()[0]
                 if with_model > 0:
                     print(f"   ✅ Events with model data: {with_model}")
                 else:
                     print(f"   ⚠️  No events with model data (hooks may need update)")
                 
-                cursor = conn.execute('SELECT COUNT(*) FROM raw_traces WHERE event_type = "database_trace"')
-                db_traces = cursor.fetchone()[0]
                 if db_traces > 0:
                     print(f"   ✅ Database traces: {db_traces}")
                 else:
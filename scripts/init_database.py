@@ -50,16 +50,17 @@ def main() -> int:
     if current_version is None:
         # First time setup - create schema
         logger.info("Creating database schema...")
-        create_schema(client)
-        
-        # Set schema version
-        client.execute(
-            "CREATE TABLE IF NOT EXISTS schema_version (version INTEGER PRIMARY KEY)"
-        )
-        client.execute(
-            "INSERT INTO schema_version (version) VALUES (?)",
-            (SCHEMA_VERSION,)
-        )
+        with client.transaction():
+            create_schema(client)
+
+            # Set schema version
+            client.execute(
+                "CREATE TABLE IF NOT EXISTS schema_version (version INTEGER PRIMARY KEY)"
+            )
+            client.execute(
+                "INSERT INTO schema_version (version) VALUES (?)",
+                (SCHEMA_VERSION,)
+            )
         logger.info(f"Database schema created (version {SCHEMA_VERSION})")
     elif current_version < SCHEMA_VERSION:
         # Migration needed
@@ -23,6 +23,67 @@ def find_project_root() -> Path:
     return current
 
 
+def _sync_tree(source: Path, target: Path) -> int:
+    """
+    Make target a copy of source, copying only files that changed.
+
+    Files are compared by size and modification time; copied files get the
+    source's modification time so unchanged files are skipped next run.
+    Files and directories no longer present in source are removed.
+    __pycache__ directories are ignored.
+
+    Args:
+        source: Source directory
+        target: Target directory (created if missing)
+
+    Returns:
+        Number of files copied
+    """
+    copied = 0
+    target.mkdir(parents=True, exist_ok=True)
+
+    with os.scandir(target) as it:
+        existing = {entry.name: entry for entry in it}
+
+    with os.scandir(source) as it:
+        for entry in it:
+            if entry.name == "__pycache__":
+                continue
+            dest = existing.pop(entry.name, None)
+            dest_path = target / entry.name
+
+            if entry.is_dir(follow_symlinks=False):
+                if dest is not None and not dest.is_dir(follow_symlinks=False):
+                    os.remove(dest.path)
+                copied += _sync_tree(Path(entry.path), dest_path)
+                continue
+
+            src_stat = entry.stat()
+            if dest is not None:
+                if dest.is_dir(follow_symlinks=False):
+                    shutil.rmtree(dest.path)
+                else:
+                    dest_stat = dest.stat(follow_symlinks=False)
+                    if (dest_stat.st_size == src_stat.st_size
+                            and dest_stat.st_mtime_ns == src_stat.st_mtime_ns):
+                        continue
+
+            shutil.copyfile(entry.path, dest_path)
+            os.utime(dest_path, ns=(src_stat.st_atime_ns, src_stat.st_mtime_ns))
+            copied += 1
+
+    # Remove anything that no longer exists in source
+    for name, stale in existing.items():
+        if name == "__pycache__":
+            continue
+        if stale.is_dir(follow_symlinks=False):
+            shutil.rmtree(stale.path)
+        else:
+            os.remove(stale.path)
+
+    return copied
+
+
 def install_hooks(source_path: Path) -> bool:
     """
     Install hooks to ~/.claude/hooks/telemetry/ directory.
@@ -58,11 +119,17 @@ def install_hooks(source_path: Path) -> bool:
             "stop.py",
         ]
 
+        # One directory listing instead of a stat per probe
+        available = set(os.listdir(source_hooks))
+        available_parent = set(os.listdir(source_hooks.parent))
+
         for hook_file in hook_files:
             source_file = source_hooks / hook_file
-            if source_file.exists():
+            if hook_file in available:
                 dest = hooks_dir / hook_file
-                shutil.copy2(source_file, dest)
+                # Plain content copy; the chmod below sets the only
+                # metadata we need, so copy2's copystat() is wasted work
+                shutil.copyfile(source_file, dest)
                 # Make executable
                 os.chmod(dest, 0o755)
                 print(f"   ✅ {hook_file}")
@@ -71,34 +138,32 @@ def install_hooks(source_path: Path) -> bool:
 
         # Copy hook_base.py to parent directory
         hook_base = source_hooks.parent / "hook_base.py"
-        if hook_base.exists():
-            shutil.copy2(hook_base, hooks_dir.parent / "hook_base.py")
+        if "hook_base.py" in available_parent:
+            shutil.copyfile(hook_base, hooks_dir.parent / "hook_base.py")
             print(f"   ✅ hook_base.py")
 
         # Copy __init__.py files
         init_file = source_hooks / "__init__.py"
-        if init_file.exists():
-            shutil.copy2(init_file, hooks_dir / "__init__.py")
+        if "__init__.py" in available:
+            shutil.copyfile(init_file, hooks_dir / "__init__.py")
 
         parent_init = source_hooks.parent / "__init__.py"
-        if parent_init.exists():
-            shutil.copy2(parent_init, hooks_dir.parent / "__init__.py")
+        if "__init__.py" in available_parent:
+            shutil.copyfile(parent_init, hooks_dir.parent / "__init__.py")
 
         # Copy capture package (for imports)
         capture_init = source_path / "src" / "capture" / "__init__.py"
         if capture_init.exists():
             capture_dir = hooks_dir.parent.parent / "capture"
             capture_dir.mkdir(exist_ok=True)
-            shutil.copy2(capture_init, capture_dir / "__init__.py")
+            shutil.copyfile(capture_init, capture_dir / "__init__.py")
 
         # Copy shared modules
         shared_dir = source_path / "src" / "capture" / "shared"
         if shared_dir.exists():
             target_shared = hooks_dir.parent / "shared"
-            if target_shared.exists():
-                shutil.rmtree(target_shared)
-            shutil.copytree(shared_dir, target_shared)
-            print(f"   ✅ shared/ (modules)")
+            copied = _sync_tree(shared_dir, target_shared)
+            print(f"   ✅ shared/ (modules, {copied} updated)")
 
         return True
 
@@ -210,8 +275,7 @@ def update_settings_json(hooks_dir: Path, backup: bool = True) -> bool:
                 print(f"   ✅ Registered {hook_name}")
 
         # Write updated settings
-        with open(settings_file, 'w') as f:
-            json.dump(settings, f, indent=4)
+        settings_file.write_text(json.dumps(settings, indent=4))
 
         print(f"\n✅ Updated {settings_file}")
         return True
@@ -241,13 +305,17 @@ def install_config(source_path: Path) -> bool:
         # Copy config files
         config_source = source_path / "config"
         if config_source.exists():
-            for config_file in config_source.glob("*.yaml"):
-                dest = blueplane_dir / config_file.name
-                if not dest.exists():  # Don't overwrite existing config
-                    shutil.copy2(config_file, dest)
-                    print(f"   ✅ {config_file.name}")
-                else:
-                    print(f"   ⏭️  {config_file.name} (already exists)")
+            # List the destination once instead of stat'ing each target
+            existing = set(os.listdir(blueplane_dir))
+            with os.scandir(config_source) as entries:
+                for entry in entries:
+                    if not entry.name.endswith(".yaml") or not entry.is_file():
+                        continue
+                    if entry.name not in existing:  # Don't overwrite existing config
+                        shutil.copyfile(entry.path, blueplane_dir / entry.name)
+                        print(f"   ✅ {entry.name}")
+                    else:
+                        print(f"   ⏭️  {entry.name} (already exists)")
 
         return True
 
@@ -83,13 +83,17 @@ def install_config(source_path: Path) -> bool:
         # Copy config files
         config_source = source_path / "config"
         if config_source.exists():
-            for config_file in config_source.glob("*.yaml"):
-                dest = blueplane_dir / config_file.name
-                if not dest.exists():  # Don't overwrite existing config
-                    shutil.copy2(config_file, dest)
-                    print(f"   ✅ {config_file.name}")
-                else:
-                    print(f"   ⏭️  {config_file.name} (already exists)")
+            # List the destination once instead of stat'ing each target
+            existing = set(os.listdir(blueplane_dir))
+            with os.scandir(config_source) as entries:
+                for entry in entries:
+                    if not entry.name.endswith(".yaml") or not entry.is_file():
+                        continue
+                    if entry.name not in existing:  # Don't overwrite existing config
+                        shutil.copyfile(entry.path, blueplane_dir / entry.name)
+                        print(f"   ✅ {entry.name}")
+                    else:
+                        print(f"   ⏭️  {entry.name} (already exists)")
 
         return True
 
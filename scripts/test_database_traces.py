@@ -52,6 +52,40 @@ def generate_database_trace_event(session_id: str = None) -> dict:
         }
     }
 
+def wait_for_session_traces(db_path: Path, session_id: str, expected: int,
+                            timeout: float = 5.0) -> int:
+    """
+    Poll SQLite until the session's traces are written, with exponential backoff.
+
+    Starts at 100ms and doubles up to a 2s cap, so fast processing is
+    detected quickly without hammering the database on slow runs.
+
+    Returns:
+        Number of traces found for the session
+    """
+    deadline = time.monotonic() + timeout
+    delay = 0.1
+    found = 0
+
+    while True:
+        if db_path.exists():
+            client = SQLiteClient(str(db_path))
+            with client.get_connection(read_only=True) as conn:
+                cursor = conn.execute(
+                    "SELECT COUNT(*) FROM raw_traces WHERE session_id = ? AND event_type = 'database_trace'",
+                    (session_id,)
+                )
+                found = cursor.fetchone()[0]
+            if found >= expected:
+                return found
+
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return found
+        time.sleep(min(delay, remaining))
+        delay = min(delay * 2, 2.0)
+
+
 def main():
     """Test database trace processing."""
     print("=" * 60)
@@ -86,12 +120,15 @@ def main():
     # Write events to Redis
     print("\n3. Writing database trace events to Redis Streams...")
     written = 0
+    lines = []
     for event in events:
         if writer.enqueue(event, 'cursor', session_id):
             written += 1
-            print(f"   ✅ Wrote: {event['event_type']} (generation_id: {event['payload']['generation_id'][:8]}...)")
+            lines.append(f"   ✅ Wrote: {event['event_type']} (generation_id: {event['payload']['generation_id'][:8]}...)")
         else:
-            print(f"   ❌ Failed: {event['event_type']}")
+            lines.append(f"   ❌ Failed: {event['event_type']}")
+    # One write for all per-event lines
+    sys.stdout.write("\n".join(lines) + "\n")
     
     print(f"\n   Wrote {written}/{len(events)} events")
     
@@ -100,12 +137,14 @@ def main():
         return 1
     
     # Wait for processing
-    print("\n4. Waiting for processing (5 seconds)...")
-    time.sleep(5)
+    db_path = Path.home() / ".blueplane" / "telemetry.db"
+    print("\n4. Waiting for processing (up to 5 seconds)...")
+    start = time.monotonic()
+    found = wait_for_session_traces(db_path, session_id, written)
+    print(f"   {found}/{written} events processed in {time.monotonic() - start:.2f}s")
     
     # Check SQLite database
     print("\n5. Checking SQLite database for database traces...")
-    db_path = Path.home() / ".blueplane" / "telemetry.db"
     
     if not db_path.exists():
         print(f"❌ Database not found: {db_path}")
@@ -113,7 +152,7 @@ def main():
     
     client = SQLiteClient(str(db_path))
     
-    with client.get_connection() as conn:
+    with client.get_connection(read_only=True) as conn:
         # Check for database_trace events
         cursor = conn.execute(
             "SELECT COUNT(*) FROM raw_traces WHERE event_type = 'database_trace'"
@@ -144,15 +183,14 @@ def main():
                 (session_id,)
             )
             print("\n   Sample database trace events:")
-            for row in cursor.fetchall():
+            for row in cursor:
                 print(f"     Sequence {row[0]}: {row[1]} ({row[2]}) model={row[5]} at {row[4]}")
         else:
             print(f"   ⚠️  No database trace events found for session {session_id}")
             print("   Check if processing server is running")
     
-    # Verify event data is compressed
-    print("\n6. Verifying event compression...")
-    with client.get_connection() as conn:
+        # Verify event data is compressed (same connection)
+        print("\n6. Verifying event compression...")
         cursor = conn.execute(
             """
             SELECT sequence, LENGTH(event_data) as size
@@ -16,6 +16,8 @@ import uuid
 from pathlib import Path
 from datetime import datetime, timezone
 
+import redis
+
 # Add project root to path
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
@@ -24,14 +26,23 @@ from src.capture.shared.queue_writer import MessageQueueWriter
 from src.capture.shared.config import Config
 from src.processing.database.sqlite_client import SQLiteClient
 
-def generate_test_event(event_type: str, session_id: str = None) -> dict:
-    """Generate a test event."""
+# Maximum time to wait for the processing server (seconds)
+PROCESSING_TIMEOUT = 10
+
+# Longest single XREAD block (ms); kept below the client socket_timeout
+# (1s by default) so a quiet stream doesn't raise a socket timeout
+XREAD_BLOCK_MS = 500
+
+def generate_test_event(event_type: str, session_id: str = None, timestamp: str = None) -> dict:
+    """Generate a test event (pass timestamp to share one across a batch)."""
     if session_id is None:
         session_id = f"test_session_{uuid.uuid4().hex[:8]}"
+    if timestamp is None:
+        timestamp = datetime.now(timezone.utc).isoformat()
     
     return {
         'hook_type': 'test',
-        'timestamp': datetime.now(timezone.utc).isoformat(),
+        'timestamp': timestamp,
         'event_type': event_type,
         'platform': 'cursor',
         'session_id': session_id,
@@ -42,10 +53,57 @@ def generate_test_event(event_type: str, session_id: str = None) -> dict:
         'payload': {
             'test_event': True,
             'event_type': event_type,
-            'generated_at': datetime.now(timezone.utc).isoformat()
+            'generated_at': timestamp
         }
     }
 
+def get_last_stream_id(redis_client, stream_name: str) -> bytes:
+    """Return the ID of the newest entry in a stream ('0-0' if empty/missing)."""
+    entries = redis_client.xrevrange(stream_name, count=1)
+    return entries[0][0] if entries else b'0-0'
+
+
+def wait_for_cdc_events(redis_client, stream_name: str, session_id: str,
+                        expected: int, start_id: bytes, timeout: float) -> int:
+    """
+    Block on the CDC stream until the session's events have been published.
+
+    Uses short XREAD BLOCK calls until the deadline, so the script wakes as
+    soon as the server publishes instead of sleeping for a fixed interval.
+
+    Returns:
+        Number of CDC events seen for the session
+    """
+    seen = 0
+    last_id = start_id
+    deadline = time.monotonic() + timeout
+    session_key = session_id.encode('utf-8')
+
+    while seen < expected:
+        remaining_ms = int((deadline - time.monotonic()) * 1000)
+        if remaining_ms <= 0:
+            break
+
+        try:
+            response = redis_client.xread(
+                {stream_name: last_id}, count=100,
+                block=min(remaining_ms, XREAD_BLOCK_MS)
+            )
+        except redis.exceptions.TimeoutError:
+            # Treat a socket timeout like an empty read
+            continue
+        if not response:
+            continue
+
+        for _, messages in response:
+            for message_id, fields in messages:
+                last_id = message_id
+                if fields.get(b'session_id') == session_key:
+                    seen += 1
+
+    return seen
+
+
 def main():
     """Generate test events and verify processing."""
     print("=" * 60)
@@ -68,37 +126,40 @@ def main():
     # Generate test events
     print("\n2. Generating test events...")
     session_id = f"test_session_{uuid.uuid4().hex[:8]}"
+    timestamp = datetime.now(timezone.utc).isoformat()
     events = [
-        generate_test_event('session_start', session_id),
-        generate_test_event('user_prompt', session_id),
-        generate_test_event('assistant_response', session_id),
-        generate_test_event('file_edit', session_id),
-        generate_test_event('session_end', session_id),
+        generate_test_event(event_type, session_id, timestamp)
+        for event_type in ('session_start', 'user_prompt', 'assistant_response',
+                           'file_edit', 'session_end')
     ]
     
     print(f"   Generated {len(events)} test events")
     print(f"   Session ID: {session_id}")
     
+    # Remember where the CDC stream ends so we only watch new entries
+    cdc_config = config.get_stream_config("cdc")
+    cdc_start_id = get_last_stream_id(writer._redis_client, cdc_config.name)
+
     # Write events to Redis
     print("\n3. Writing events to Redis Streams...")
-    written = 0
-    for event in events:
-        if writer.enqueue(event, 'cursor', session_id):
-            written += 1
-            print(f"   ✅ Wrote: {event['event_type']}")
-        else:
-            print(f"   ❌ Failed: {event['event_type']}")
+    # Single pipelined round-trip for the whole batch
+    written = writer.enqueue_batch(events, 'cursor', session_id)
     
-    print(f"\n   Wrote {written}/{len(events)} events")
+    print(f"   Wrote {written}/{len(events)} events")
     
     if written == 0:
         print("❌ No events were written. Check Redis connection.")
         return 1
     
-    # Wait a bit for processing
-    print("\n4. Waiting for processing (5 seconds)...")
+    # Wait for the server to publish CDC events for our session
+    print(f"\n4. Waiting for processing (up to {PROCESSING_TIMEOUT} seconds)...")
     print("   (Start the processing server in another terminal if not running)")
-    time.sleep(5)
+    start = time.monotonic()
+    published = wait_for_cdc_events(
+        writer._redis_client, cdc_config.name, session_id,
+        written, cdc_start_id, PROCESSING_TIMEOUT
+    )
+    print(f"   {published}/{written} events processed in {time.monotonic() - start:.2f}s")
     
     # Check SQLite database
     print("\n5. Checking SQLite database...")
@@ -111,22 +172,20 @@ def main():
     client = SQLiteClient(str(db_path))
     
     with client.get_connection() as conn:
+        # One query for both the count and the sample rows
         cursor = conn.execute(
-            "SELECT COUNT(*) FROM raw_traces WHERE session_id = ?",
+            "SELECT sequence, event_type, platform, timestamp FROM raw_traces WHERE session_id = ? ORDER BY sequence",
             (session_id,)
         )
-        count = cursor.fetchone()[0]
+        rows = cursor.fetchall()
+        count = len(rows)
         
         if count > 0:
             print(f"✅ Found {count} events in database for session {session_id}")
             
             # Show sample events
-            cursor = conn.execute(
-                "SELECT sequence, event_type, platform, timestamp FROM raw_traces WHERE session_id = ? ORDER BY sequence LIMIT 5",
-                (session_id,)
-            )
             print("\n   Sample events:")
-            for row in cursor.fetchall():
+            for row in rows[:5]:
                 print(f"     Sequence {row[0]}: {row[1]} ({row[2]}) at {row[3]}")
         else:
             print(f"⚠️  No events found in database for session {session_id}")
@@ -135,25 +194,29 @@ def main():
             print("   - Events are still being processed")
             print("   - Check server logs for errors")
     
-    # Check CDC stream
+    # Check CDC stream (length and consumer groups in one round-trip)
     print("\n6. Checking CDC stream...")
     try:
-        import redis
-        redis_client = redis.Redis(
-            host=config.redis.host,
-            port=config.redis.port,
-            db=config.redis.db,
-            decode_responses=False
-        )
+        pipe = writer._redis_client.pipeline(transaction=False)
+        pipe.xlen(cdc_config.name)
+        pipe.xinfo_groups(cdc_config.name)
+        cdc_length, cdc_groups = pipe.execute(raise_on_error=False)
         
-        cdc_config = config.get_stream_config("cdc")
-        cdc_length = redis_client.xlen(cdc_config.name)
+        if isinstance(cdc_length, Exception):
+            raise cdc_length
         print(f"   CDC stream '{cdc_config.name}' has {cdc_length} entries")
         
         if cdc_length > 0:
             print("   ✅ CDC events are being published")
         else:
             print("   ⚠️  No CDC events found (server may not be running)")
+        
+        if not isinstance(cdc_groups, Exception):
+            for group in cdc_groups:
+                name = group.get('name')
+                if isinstance(name, bytes):
+                    name = name.decode('utf-8')
+                print(f"   Group '{name}': pending={group.get('pending')}, lag={group.get('lag')}")
     except Exception as e:
         print(f"   ⚠️  Could not check CDC stream: {e}")
     
@@ -11,6 +11,9 @@ Checks that all components are installed and configured correctly.
 
 import sys
 import os
+import io
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import argparse
 
@@ -46,20 +49,27 @@ def check_redis_connection() -> bool:
     try:
         import redis
         client = redis.Redis(host='localhost', port=6379, socket_timeout=2)
-        client.ping()
+
+        # Ping and stream checks in one round-trip; per-command errors
+        # (e.g. missing stream) are returned instead of raised
+        pipe = client.pipeline(transaction=False)
+        pipe.ping()
+        pipe.xinfo_stream('telemetry:events')
+        pipe.xinfo_groups('telemetry:events')
+        pong, info, groups = pipe.execute(raise_on_error=False)
+        if isinstance(pong, Exception):
+            raise pong
         print(f"   ✅ Connected to Redis at localhost:6379")
 
         # Check streams
-        try:
-            info = client.xinfo_stream('telemetry:events')
+        if not isinstance(info, Exception):
             print(f"   ✅ Stream 'telemetry:events' exists")
-        except:
+        else:
             print(f"   ⚠️  Stream 'telemetry:events' not found (run init_redis.py)")
 
-        try:
-            groups = client.xinfo_groups('telemetry:events')
+        if not isinstance(groups, Exception):
             print(f"   ✅ Consumer groups configured")
-        except:
+        else:
             print(f"   ⚠️  Consumer groups not found (run init_redis.py)")
 
         return True
@@ -78,7 +88,10 @@ def check_hooks_installation() -> bool:
     print(f"\n🪝 Checking global hooks installation...")
 
     hooks_dir = Path.home() / ".cursor" / "hooks"
-    if not hooks_dir.exists():
+    try:
+        # One directory scan instead of exists()/access() per file
+        entries = {entry.name: entry for entry in os.scandir(hooks_dir)}
+    except (FileNotFoundError, NotADirectoryError):
         print(f"   ❌ Global hooks directory not found: {hooks_dir}")
         print(f"   💡 Run: python scripts/install_cursor.py")
         return False
@@ -100,24 +113,23 @@ def check_hooks_installation() -> bool:
 
     all_found = True
     for hook in expected_hooks:
-        hook_path = hooks_dir / hook
-        if hook_path.exists() and os.access(hook_path, os.X_OK):
+        entry = entries.get(hook)
+        if entry is not None and entry.is_file() and entry.stat().st_mode & 0o111:
             print(f"   ✅ {hook}")
         else:
             print(f"   ❌ {hook} (missing or not executable)")
             all_found = False
 
     # Check hook_base.py
-    hook_base = hooks_dir / "hook_base.py"
-    if hook_base.exists():
+    if "hook_base.py" in entries:
         print(f"   ✅ hook_base.py")
     else:
         print(f"   ⚠️  hook_base.py not found")
         all_found = False
 
     # Check shared modules
-    shared_dir = hooks_dir / "shared"
-    if shared_dir.exists():
+    shared_dir = entries.get("shared")
+    if shared_dir is not None and shared_dir.is_dir():
         print(f"   ✅ shared/ (modules)")
     else:
         print(f"   ⚠️  shared/ directory not found")
@@ -198,6 +210,48 @@ def test_hook_execution() -> bool:
         return False
 
 
+class _PerThreadStdout:
+    """stdout proxy that sends each worker thread's output to its own buffer."""
+
+    def __init__(self, default):
+        self._default = default
+        self._local = threading.local()
+
+    def _target(self):
+        return getattr(self._local, 'buffer', None) or self._default
+
+    def write(self, text: str) -> int:
+        return self._target().write(text)
+
+    def flush(self) -> None:
+        self._target().flush()
+
+    def __getattr__(self, name):
+        # encoding, isatty(), etc. come from the real stdout
+        return getattr(self._default, name)
+
+    def run(self, check_fn):
+        """
+        Run a check with its output captured.
+
+        Args:
+            check_fn: Check function returning True/False
+
+        Returns:
+            Tuple of (result, captured output)
+        """
+        self._local.buffer = io.StringIO()
+        try:
+            try:
+                result = check_fn()
+            except Exception as e:
+                print(f"   ❌ Check failed: {e}")
+                result = False
+            return result, self._local.buffer.getvalue()
+        finally:
+            self._local.buffer = None
+
+
 def main():
     """Main entry point."""
     parser = argparse.ArgumentParser(
@@ -216,9 +270,22 @@ def main():
         ("Hook Execution", lambda: test_hook_execution()),
     ]
 
+    # Checks are independent and mostly wait on I/O (Redis, hook
+    # subprocess), so run them concurrently and print their output in order
+    stdout = sys.stdout
+    proxy = _PerThreadStdout(stdout)
+    sys.stdout = proxy
+    try:
+        with ThreadPoolExecutor(max_workers=len(checks)) as executor:
+            futures = [(name, executor.submit(proxy.run, check_fn)) for name, check_fn in checks]
+            outcomes = [(name, future.result()) for name, future in futures]
+    finally:
+        sys.stdout = stdout
+
     results = {}
-    for name, check_fn in checks:
-        results[name] = check_fn()
+    for name, (result, output) in outcomes:
+        sys.stdout.write(output)
+        results[name] = result
 
     # Summary
     print("\n" + "=" * 60)
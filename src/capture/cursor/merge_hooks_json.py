@@ -148,8 +148,9 @@ def save_hooks_json(file_path: Path, config: Dict[str, Any]) -> None:
         config: Configuration dictionary
     """
     file_path.parent.mkdir(parents=True, exist_ok=True)
-    with open(file_path, 'w') as f:
-        json.dump(config, f, indent=2)
+    # Serialize in one pass and write with a single call; json.dump()
+    # streams many small chunks through the file object
+    file_path.write_text(json.dumps(config, indent=2))
 
 
 def main():
@@ -13,7 +13,7 @@ import json
 import uuid
 import logging
 from datetime import datetime, timezone
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 from pathlib import Path
 
 try:
@@ -34,6 +34,14 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Fields every event must provide
+REQUIRED_EVENT_FIELDS = ("hook_type", "timestamp")
+
+# Event keys already mapped explicitly onto the stream entry
+MAPPED_EVENT_FIELDS = frozenset(
+    ("hook_type", "timestamp", "payload", "metadata", "event_type")
+)
+
 
 class MessageQueueWriter:
     """
@@ -114,6 +122,67 @@ class MessageQueueWriter:
             logger.warning("Unexpected error initializing Redis: %s", e)
             self._redis_client = None
 
+    def _build_stream_entry(
+        self,
+        event: Dict[str, Any],
+        platform: str,
+        session_id: str
+    ) -> Optional[Dict[str, str]]:
+        """
+        Validate an event and flatten it into a Redis stream entry.
+
+        Args:
+            event: Event dictionary with hook_type, timestamp, payload
+            platform: Platform identifier (claude_code, cursor)
+            session_id: Session identifier
+
+        Returns:
+            Stream entry (flat string key-value pairs), or None if invalid
+        """
+        # Validate event (basic check)
+        if not isinstance(event, dict):
+            logger.error("Event must be a dictionary")
+            return None
+
+        for field in REQUIRED_EVENT_FIELDS:
+            if field not in event:
+                logger.error("Event missing required field: %s", field)
+                return None
+
+        # Build Redis stream entry (flat key-value pairs)
+        # Redis Streams requires all values to be strings
+        stream_entry = {
+            'event_id': str(uuid.uuid4()),
+            'enqueued_at': datetime.now(timezone.utc).isoformat(),
+            'retry_count': '0',
+            'platform': platform,
+            'external_session_id': session_id,
+            'hook_type': event['hook_type'],
+            'timestamp': event['timestamp'],
+        }
+
+        # Add event_type if present
+        if 'event_type' in event:
+            stream_entry['event_type'] = event['event_type']
+
+        # Serialize complex data (payload, metadata) to JSON
+        if 'payload' in event:
+            stream_entry['payload'] = json.dumps(event['payload'])
+
+        if 'metadata' in event:
+            stream_entry['metadata'] = json.dumps(event['metadata'])
+
+        # Add any additional top-level fields
+        for key, value in event.items():
+            if key not in MAPPED_EVENT_FIELDS:
+                # Store additional fields as JSON
+                if isinstance(value, (dict, list)):
+                    stream_entry[key] = json.dumps(value)
+                else:
+                    stream_entry[key] = str(value)
+
+        return stream_entry
+
     def enqueue(
         self,
         event: Dict[str, Any],
@@ -147,53 +216,10 @@ class MessageQueueWriter:
             return False
 
         try:
-            # Generate event ID
-            event_id = str(uuid.uuid4())
-            enqueued_at = datetime.now(timezone.utc).isoformat()
-
-            # Validate event (basic check)
-            if not isinstance(event, dict):
-                logger.error("Event must be a dictionary")
+            stream_entry = self._build_stream_entry(event, platform, session_id)
+            if stream_entry is None:
                 return False
 
-            required_fields = ["hook_type", "timestamp"]
-            for field in required_fields:
-                if field not in event:
-                    logger.error("Event missing required field: %s", field)
-                    return False
-
-            # Build Redis stream entry (flat key-value pairs)
-            # Redis Streams requires all values to be strings
-            stream_entry = {
-                'event_id': event_id,
-                'enqueued_at': enqueued_at,
-                'retry_count': '0',
-                'platform': platform,
-                'external_session_id': session_id,
-                'hook_type': event['hook_type'],
-                'timestamp': event['timestamp'],
-            }
-
-            # Add event_type if present
-            if 'event_type' in event:
-                stream_entry['event_type'] = event['event_type']
-
-            # Serialize complex data (payload, metadata) to JSON
-            if 'payload' in event:
-                stream_entry['payload'] = json.dumps(event['payload'])
-
-            if 'metadata' in event:
-                stream_entry['metadata'] = json.dumps(event['metadata'])
-
-            # Add any additional top-level fields
-            for key, value in event.items():
-                if key not in ['hook_type', 'timestamp', 'payload', 'metadata', 'event_type']:
-                    # Store additional fields as JSON
-                    if isinstance(value, (dict, list)):
-                        stream_entry[key] = json.dumps(value)
-                    else:
-                        stream_entry[key] = str(value)
-
             # Write to Redis Streams with auto-trim
             message_id = self._redis_client.xadd(
                 name=self.stream_config.name,
@@ -204,7 +230,7 @@ class MessageQueueWriter:
 
             logger.debug(
                 "Enqueued event %s to stream %s with ID %s",
-                event_id,
+                stream_entry['event_id'],
                 self.stream_config.name,
                 message_id
             )
@@ -226,6 +252,80 @@ class MessageQueueWriter:
             logger.error("Unexpected error enqueueing event: %s", e, exc_info=True)
             return False
 
+    def enqueue_batch(
+        self,
+        events: List[Dict[str, Any]],
+        platform: str,
+        session_id: str
+    ) -> int:
+        """
+        Write multiple events to the message queue in one round-trip.
+
+        Events are validated and flattened exactly as in enqueue(), then
+        sent through a single non-transactional pipeline. Invalid events
+        are skipped.
+
+        Args:
+            events: List of event dictionaries
+            platform: Platform identifier (claude_code, cursor)
+            session_id: Session identifier
+
+        Returns:
+            Number of events written (0 on failure, never raises)
+        """
+        if not REDIS_AVAILABLE or self._redis_client is None:
+            logger.debug("Redis not available, skipping events")
+            return 0
+
+        try:
+            pipe = self._redis_client.pipeline(transaction=False)
+            queued = 0
+            for event in events:
+                stream_entry = self._build_stream_entry(event, platform, session_id)
+                if stream_entry is None:
+                    continue
+                pipe.xadd(
+                    name=self.stream_config.name,
+                    fields=stream_entry,
+                    maxlen=self.stream_config.max_length,
+                    approximate=self.stream_config.trim_approximate
+                )
+                queued += 1
+
+            if not queued:
+                return 0
+
+            # Per-command errors are returned, not raised, so XADDs that
+            # succeeded before a failing one are still counted
+            results = pipe.execute(raise_on_error=False)
+            written = 0
+            for result in results:
+                if isinstance(result, Exception):
+                    logger.error("Redis error: %s", result)
+                else:
+                    written += 1
+
+            logger.debug(
+                "Enqueued %d of %d events to stream %s",
+                written,
+                queued,
+                self.stream_config.name
+            )
+
+            return written
+
+        except (ConnectionError, TimeoutError) as e:
+            logger.warning("Network error writing to Redis: %s", e)
+            return 0
+
+        except RedisError as e:
+            logger.error("Redis error: %s", e)
+            return 0
+
+        except Exception as e:
+            logger.error("Unexpected error enqueueing events: %s", e, exc_info=True)
+            return 0
+
     def enqueue_to_dlq(
         self,
         original_event: Dict[str, Any],
@@ -15,11 +15,41 @@ import logging
 import hashlib
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Dict, Any, Optional, Set
+from typing import Dict, Any, List, Optional, Tuple
 import redis
 
+from ..json_codec import encode_stream_value, loads
+
 logger = logging.getLogger(__name__)
 
+# Maximum number of transcript entries sent per Redis pipeline
+XADD_BATCH_SIZE = 500
+
+# Bytes kept from the end of the consumed part of each transcript; if they
+# no longer match on the next pass, the file was rewritten
+TAIL_FINGERPRINT_SIZE = 64
+
+
+def _get_field(data: Dict[Any, Any], name: str, default: str = '') -> str:
+    """
+    Get a single field from a raw stream entry, decoding it if needed.
+
+    Args:
+        data: Stream entry fields (bytes or str keys/values)
+        name: Field name
+        default: Value returned if the field is missing
+
+    Returns:
+        Field value as a string
+    """
+    value = data.get(name.encode('utf-8'))
+    if value is None:
+        value = data.get(name)
+    if value is None:
+        return default
+    return value.decode('utf-8') if isinstance(value, bytes) else value
+
+
 
 class ClaudeCodeTranscriptMonitor:
     """
@@ -30,7 +60,8 @@ class ClaudeCodeTranscriptMonitor:
     2. Extracts transcript_path from the event payload
     3. Reads and processes the JSONL transcript file
     4. Sends trace events to Redis for each entry in the transcript
-    5. Tracks processed sessions to avoid duplicates
+    5. Tracks how far each transcript has been read, so later hooks for the
+       same session only send the entries appended since
     """
 
     def __init__(
@@ -57,9 +88,12 @@ class ClaudeCodeTranscriptMonitor:
         self.consumer_name = consumer_name
         self.poll_interval = poll_interval
 
-        # Track processed transcripts to avoid duplicates
+        # Read position per transcript, so each entry is sent once
         # Key format: "session_id:transcript_path_hash"
-        self.processed_transcripts: Set[str] = set()
+        # Value: {"offset": bytes consumed, "entries": entries sent,
+        #         "tail": last bytes consumed (rewrite fingerprint),
+        #         "workspace_hash": hash computed on first read}
+        self.transcript_state: Dict[str, Dict[str, Any]] = {}
 
         # Running flag
         self.running = False
@@ -111,18 +145,16 @@ class ClaudeCodeTranscriptMonitor:
                 if not events:
                     continue
 
-                # Process each event
+                # Collect transcripts to process; a batch often carries both
+                # Stop and SessionEnd for the same transcript, so each is
+                # read once per batch
+                message_ids = []
+                transcripts: Dict[Tuple[str, str], str] = {}
                 for stream_name, messages in events:
                     for message_id, data in messages:
+                        message_ids.append(message_id)
                         try:
-                            await self._process_event(message_id, data)
-
-                            # Acknowledge message
-                            self.redis_client.xack(
-                                self.stream_name,
-                                self.consumer_group,
-                                message_id
-                            )
+                            trigger = self._get_transcript_trigger(data)
                         except Exception as e:
                             logger.error(
                                 "Error processing message %s: %s",
@@ -130,81 +162,75 @@ class ClaudeCodeTranscriptMonitor:
                                 e,
                                 exc_info=True
                             )
-                            # Still acknowledge to prevent reprocessing
-                            self.redis_client.xack(
-                                self.stream_name,
-                                self.consumer_group,
-                                message_id
-                            )
+                            continue
+                        if trigger:
+                            session_id, transcript_path, hook_type = trigger
+                            transcripts[(session_id, transcript_path)] = hook_type
+
+                for (session_id, transcript_path), hook_type in transcripts.items():
+                    logger.info("Processing transcript for session %s from %s hook: %s",
+                               session_id, hook_type, transcript_path)
+                    await self._process_transcript(session_id, transcript_path, hook_type)
+
+                # Acknowledge the whole batch, including failed messages,
+                # to prevent reprocessing
+                if message_ids:
+                    self.redis_client.xack(
+                        self.stream_name,
+                        self.consumer_group,
+                        *message_ids
+                    )
 
             except Exception as e:
                 logger.error("Error in monitor loop: %s", e, exc_info=True)
                 await asyncio.sleep(self.poll_interval)
 
-    async def _process_event(self, message_id: bytes, data: Dict[bytes, bytes]) -> None:
+    def _get_transcript_trigger(self, data: Dict[bytes, bytes]) -> Optional[Tuple[str, str, str]]:
         """
-        Process a single event from the stream.
+        Check whether a stream event should trigger transcript processing.
 
         Args:
-            message_id: Redis stream message ID
             data: Event data dictionary
-        """
-        # Decode bytes to strings
-        decoded_data = {
-            k.decode('utf-8') if isinstance(k, bytes) else k:
-            v.decode('utf-8') if isinstance(v, bytes) else v
-            for k, v in data.items()
-        }
 
-        # Check if this is a Stop or SessionEnd hook from claude_code platform
-        platform = decoded_data.get('platform', '')
-        hook_type = decoded_data.get('hook_type', '')
+        Returns:
+            Tuple of (session_id, transcript_path, hook_type), or None if the
+            event is not a Claude Code Stop/SessionEnd hook with a transcript
+        """
+        # Check if this is a Stop or SessionEnd hook from claude_code platform.
+        # Only the fields needed for the decision are decoded: most events on
+        # the stream (including our own transcript traces, whose payload
+        # carries a full transcript entry) are skipped here.
+        platform = _get_field(data, 'platform')
+        hook_type = _get_field(data, 'hook_type')
 
         if platform != 'claude_code' or hook_type not in ('Stop', 'SessionEnd'):
             # Not a Claude Code Stop or SessionEnd hook, skip
-            return
+            return None
 
         # Extract session_id and payload
-        session_id = decoded_data.get('external_session_id')
+        session_id = _get_field(data, 'external_session_id')
         if not session_id:
             logger.warning("%s hook missing session_id", hook_type)
-            return
+            return None
 
         # Parse payload to get transcript_path
-        payload_str = decoded_data.get('payload', '{}')
+        payload_str = _get_field(data, 'payload', '{}')
         try:
             payload = json.loads(payload_str)
         except json.JSONDecodeError:
             logger.error("Failed to parse payload: %s", payload_str)
-            return
+            return None
 
         transcript_path = payload.get('transcript_path')
         if not transcript_path:
             logger.debug("%s hook has no transcript_path, skipping", hook_type)
-            return
-
-        # Check if this specific transcript has already been processed
-        # Use hash of transcript path to create unique key
-        import hashlib
-        path_hash = hashlib.sha256(str(transcript_path).encode()).hexdigest()[:16]
-        dedup_key = f"{session_id}:{path_hash}"
-
-        if dedup_key in self.processed_transcripts:
-            logger.debug("Transcript %s for session %s already processed, skipping",
-                        transcript_path, session_id)
-            return
-
-        # Process the transcript
-        logger.info("Processing transcript for session %s from %s hook: %s",
-                   session_id, hook_type, transcript_path)
-        await self._process_transcript(session_id, transcript_path, hook_type)
+            return None
 
-        # Mark as processed
-        self.processed_transcripts.add(dedup_key)
+        return session_id, str(transcript_path), hook_type
 
     async def _process_transcript(self, session_id: str, transcript_path: str, hook_type: str = None) -> None:
         """
-        Process a Claude Code transcript file.
+        Send the entries appended to a Claude Code transcript since the last pass.
 
         Args:
             session_id: Session ID
@@ -217,50 +243,166 @@ class ClaudeCodeTranscriptMonitor:
                 logger.warning("Transcript file not found: %s", transcript_path)
                 return
 
-            # Read JSONL file
-            with open(path, 'r') as f:
-                lines = f.readlines()
+            # Use hash of transcript path to create unique key
+            path_hash = hashlib.sha256(str(transcript_path).encode()).hexdigest()[:16]
+            state_key = f"{session_id}:{path_hash}"
+            state = self.transcript_state.get(state_key)
+
+            offset = state["offset"] if state else 0
+            tail = state["tail"] if state else b''
+
+            # Read only the bytes appended since the last pass, plus the
+            # already-consumed tail used to detect a truncated or replaced file
+            with open(path, 'rb') as f:
+                f.seek(offset - len(tail))
+                data = f.read()
+                if data.startswith(tail):
+                    data = data[len(tail):]
+                else:
+                    logger.info("Transcript %s was rewritten, re-reading from start", transcript_path)
+                    state = None
+                    offset = 0
+                    tail = b''
+                    f.seek(0)
+                    data = f.read()
+
+            # Leave a trailing partial line for the next pass
+            end = data.rfind(b'\n') + 1
+            if end == 0:
+                logger.debug("No new transcript entries for session %s", session_id)
+                return
 
-            # Parse all entries first (needed for workspace hash extraction)
+            # Parse the raw bytes directly (no decode step), remembering where
+            # each entry's line ends so progress can stop after a failed batch
             entries = []
-            for line in lines:
+            line_ends = []
+            pos = 0
+            for line in data[:end].split(b'\n')[:-1]:
+                pos += len(line) + 1
                 if not line.strip():
                     continue
                 try:
-                    entries.append(json.loads(line))
-                except json.JSONDecodeError:
+                    entry = loads(line)
+                except (json.JSONDecodeError, UnicodeDecodeError):
                     continue
-
-            logger.info("Processing %d transcript entries for session %s (from %s hook)",
+                if not isinstance(entry, dict):
+                    continue
+                entries.append(entry)
+                line_ends.append(pos)
+
+            if state is None:
+                # Extract workspace hash from the start of the transcript
+                workspace_hash = self._get_workspace_hash_from_transcript(transcript_path, entries)
+                logger.debug("Extracted workspace hash: %s for transcript: %s",
+                            workspace_hash, transcript_path)
+                state = {"offset": 0, "entries": 0, "tail": b'', "workspace_hash": workspace_hash}
+            workspace_hash = state["workspace_hash"]
+            first_line_num = state["entries"] + 1
+
+            logger.info("Processing %d new transcript entries for session %s (from %s hook)",
                        len(entries), session_id, hook_type or "unknown")
 
-            # Extract workspace hash from transcript
-            workspace_hash = self._get_workspace_hash_from_transcript(transcript_path, entries)
-            logger.debug("Extracted workspace hash: %s for transcript: %s",
-                        workspace_hash, transcript_path)
+            # Timestamp for entries that don't carry their own (computed once)
+            fallback_timestamp = datetime.now(timezone.utc).isoformat()
+
+            # Send entries in batches, one round-trip per batch. Stop at the
+            # first failed batch so it is retried on the next pass.
+            sent_end = end
+            sent_entries = len(entries)
+            for start in range(0, len(entries), XADD_BATCH_SIZE):
+                batch = entries[start:start + XADD_BATCH_SIZE]
+                if not self._send_transcript_entries(
+                    session_id, batch, first_line_num + start, workspace_hash, fallback_timestamp
+                ):
+                    sent_end = line_ends[start - 1] if start else 0
+                    sent_entries = start
+                    break
+
+            if sent_end == 0:
+                return
 
-            # Process each entry
-            for line_num, entry in enumerate(entries, start=1):
-                await self._process_transcript_entry(session_id, entry, line_num, workspace_hash)
+            state["offset"] = offset + sent_end
+            state["tail"] = (tail + data[:sent_end])[-TAIL_FINGERPRINT_SIZE:]
+            state["entries"] += sent_entries
+            self.transcript_state[state_key] = state
 
         except Exception as e:
             logger.error("Error processing transcript %s: %s", transcript_path, e, exc_info=True)
 
-    async def _process_transcript_entry(
+    def _send_transcript_entries(
+        self,
+        session_id: str,
+        entries: List[Dict[str, Any]],
+        first_line_num: int,
+        workspace_hash: str = None,
+        fallback_timestamp: str = None
+    ) -> bool:
+        """
+        Send a batch of transcript entries to Redis using a single pipeline.
+
+        Args:
+            session_id: Session ID
+            entries: Transcript entry dictionaries
+            first_line_num: Line number of the first entry in the batch
+            workspace_hash: Pre-computed workspace hash
+            fallback_timestamp: Timestamp for entries without one
+
+        Returns:
+            True if the batch was sent, False otherwise
+        """
+        last_line_num = first_line_num + len(entries) - 1
+        try:
+            pipe = self.redis_client.pipeline(transaction=False)
+            for line_num, entry in enumerate(entries, start=first_line_num):
+                pipe.xadd(
+                    self.stream_name,
+                    self._build_stream_entry(
+                        session_id, entry, line_num, workspace_hash, fallback_timestamp
+                    ),
+                    maxlen=10000,
+                    approximate=True
+                )
+            pipe.execute()
+
+            logger.debug(
+                "Sent transcript traces for session %s, lines %d-%d",
+                session_id,
+                first_line_num,
+                last_line_num
+            )
+            return True
+
+        except Exception as e:
+            logger.error(
+                "Failed to send transcript traces for session %s, lines %d-%d: %s",
+                session_id,
+                first_line_num,
+                last_line_num,
+                e
+            )
+            return False
+
+    def _build_stream_entry(
         self,
         session_id: str,
         entry: Dict[str, Any],
         line_num: int,
-        workspace_hash: str = None
-    ) -> None:
+        workspace_hash: str = None,
+        fallback_timestamp: str = None
+    ) -> Dict[str, str]:
         """
-        Process a single transcript entry and send to Redis.
+        Build the Redis stream entry for a single transcript entry.
 
         Args:
             session_id: Session ID
             entry: Transcript entry dictionary
             line_num: Line number in transcript file
             workspace_hash: Pre-computed workspace hash
+            fallback_timestamp: Timestamp for entries without one
+                (defaults to now)
+
+        Returns:
+            Flat stream entry with JSON-encoded nested values
         """
         # Extract metadata from transcript entry
         # Claude Code transcript format typically includes:
@@ -279,7 +421,7 @@ class ClaudeCodeTranscriptMonitor:
             "version": "0.1.0",
             "hook_type": "TranscriptTrace",
             "event_type": "transcript_trace",  # Distinct event type for Claude Code transcripts
-            "timestamp": timestamp or datetime.now(timezone.utc).isoformat(),
+            "timestamp": timestamp or fallback_timestamp or datetime.now(timezone.utc).isoformat(),
             "platform": "claude_code",
             "session_id": session_id,
             "external_session_id": session_id,
@@ -316,33 +458,7 @@ class ClaudeCodeTranscriptMonitor:
                         event['payload']['prompt_tokens'] = input_tokens
                         event['payload']['completion_tokens'] = output_tokens
 
-        # Send to Redis stream
-        try:
-            stream_entry = {
-                k: json.dumps(v) if isinstance(v, (dict, list)) else str(v)
-                for k, v in event.items()
-            }
-
-            self.redis_client.xadd(
-                self.stream_name,
-                stream_entry,
-                maxlen=10000,
-                approximate=True
-            )
-
-            logger.debug(
-                "Sent transcript trace for session %s, line %d",
-                session_id,
-                line_num
-            )
-
-        except Exception as e:
-            logger.error(
-                "Failed to send transcript trace for session %s, line %d: %s",
-                session_id,
-                line_num,
-                e
-            )
+        return {k: encode_stream_value(v) for k, v in event.items()}
 
     def _get_workspace_hash_from_transcript(self, transcript_path: str, transcript_content: list = None) -> str:
         """
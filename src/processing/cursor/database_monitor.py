@@ -17,18 +17,34 @@ import json
 import logging
 import time
 from pathlib import Path
-from typing import Dict, Optional, Set, Tuple
+from typing import Any, Dict, Optional, Set, Tuple
 import aiosqlite
 import redis
 
+from ..json_codec import encode_stream_value, loads
 from .session_monitor import SessionMonitor
-from .workspace_mapper import WorkspaceMapper
+from .workspace_mapper import GENERATIONS_ARRAY_SQL, WorkspaceMapper
 
 logger = logging.getLogger(__name__)
 
-# ItemTable keys for AI service data
+# ItemTable key for AI service generations
 GENERATIONS_KEY = "aiService.generations"
-PROMPTS_KEY = "aiService.prompts"
+
+# Maximum number of generations sent per Redis pipeline
+XADD_BATCH_SIZE = 500
+
+# Generations newer than a timestamp, filtered and ordered inside SQLite.
+# Non-array or malformed values yield no rows instead of an error.
+NEW_GENERATIONS_QUERY = """
+    SELECT g.value
+    FROM ItemTable AS i,
+         json_each({array}) AS g
+    WHERE i.key = ?
+      AND g.type = 'object'
+      AND json_extract(g.value, '$.unixMs') > ?
+    ORDER BY json_extract(g.value, '$.unixMs')
+""".format(array=GENERATIONS_ARRAY_SQL)
+
 
 
 class CursorDatabaseMonitor:
@@ -65,6 +81,10 @@ class CursorDatabaseMonitor:
         # Database connections (lazy-loaded, one per workspace)
         self.db_connections: Dict[str, aiosqlite.Connection] = {}
 
+        # PRAGMA data_version seen at the last successful check per workspace;
+        # unchanged means no other connection has committed since
+        self.data_versions: Dict[str, int] = {}
+
         # Deduplication: Track seen generation_ids
         self.seen_generations: Set[Tuple[str, str]] = set()  # (workspace_hash, generation_id)
         self.generation_ttl: Dict[Tuple[str, str], float] = {}  # TTL for cleanup
@@ -164,10 +184,13 @@ class CursorDatabaseMonitor:
     ) -> bool:
         """Open database connection with aggressive timeouts."""
         try:
-            # Open connection with short timeout
+            # Open read-only (mode=ro) with short timeout: the database
+            # belongs to Cursor, so never change its journal mode or take
+            # write locks on it
             conn = await asyncio.wait_for(
                 aiosqlite.connect(
-                    str(db_path),
+                    f"{db_path.resolve().as_uri()}?mode=ro",
+                    uri=True,
                     timeout=self.query_timeout,
                     check_same_thread=False
                 ),
@@ -175,7 +198,6 @@ class CursorDatabaseMonitor:
             )
 
             # Configure for read-only, non-blocking
-            await conn.execute("PRAGMA journal_mode=WAL")
             await conn.execute("PRAGMA read_uncommitted=1")
             await conn.execute("PRAGMA query_only=1")  # Read-only mode
 
@@ -248,6 +270,12 @@ class CursorDatabaseMonitor:
         if not conn:
             return
 
+        # Skip the generations query if Cursor hasn't written since last check
+        data_version = await self._get_data_version(conn)
+        if data_version is not None and self.data_versions.get(workspace_hash) == data_version:
+            logger.debug(f"No database changes for {workspace_hash}")
+            return
+
         last_timestamp_ms = self.last_synced_timestamp.get(workspace_hash, 0)
 
         # Retry logic with exponential backoff
@@ -265,6 +293,8 @@ class CursorDatabaseMonitor:
                 )
 
                 self._update_health(workspace_hash, "synced", None)
+                if data_version is not None:
+                    self.data_versions[workspace_hash] = data_version
                 break  # Success, exit retry loop
 
             except asyncio.TimeoutError:
@@ -288,71 +318,57 @@ class CursorDatabaseMonitor:
                     logger.error(f"Error checking changes for {workspace_hash}: {e}")
                     break
 
-    async def _get_generations_from_itemtable(
-        self,
-        conn: aiosqlite.Connection
-    ) -> list:
-        """Read generations array from ItemTable."""
+    async def _get_data_version(self, conn: aiosqlite.Connection) -> Optional[int]:
+        """
+        Read the connection's PRAGMA data_version.
+
+        Args:
+            conn: Open Cursor database connection
+
+        Returns:
+            Data version, or None if it could not be read
+        """
         try:
-            cursor = await conn.execute('''
-                SELECT value FROM ItemTable WHERE key = ?
-            ''', (GENERATIONS_KEY,))
+            cursor = await conn.execute("PRAGMA data_version")
             row = await cursor.fetchone()
-            
-            if not row or not row[0]:
-                return []
-            
-            # Parse JSON array
-            value_str = row[0]
-            if isinstance(value_str, bytes):
-                value_str = value_str.decode('utf-8')
-            
-            generations = json.loads(value_str)
-            
-            if not isinstance(generations, list):
-                logger.warning(f"Expected list for {GENERATIONS_KEY}, got {type(generations)}")
-                return []
-            
-            return generations
-        except json.JSONDecodeError as e:
-            logger.error(f"Failed to parse generations JSON: {e}")
-            return []
+            return row[0] if row else None
         except Exception as e:
-            logger.debug(f"Error reading generations from ItemTable: {e}")
-            return []
+            logger.debug(f"Error reading data_version: {e}")
+            return None
 
-    async def _get_prompts_from_itemtable(
+    async def _get_generations_from_itemtable(
         self,
-        conn: aiosqlite.Connection
+        conn: aiosqlite.Connection,
+        since_ms: int = 0
     ) -> list:
-        """Read prompts array from ItemTable."""
-        try:
-            cursor = await conn.execute('''
-                SELECT value FROM ItemTable WHERE key = ?
-            ''', (PROMPTS_KEY,))
-            row = await cursor.fetchone()
-            
-            if not row or not row[0]:
-                return []
-            
-            # Parse JSON array
-            value_str = row[0]
-            if isinstance(value_str, bytes):
-                value_str = value_str.decode('utf-8')
-            
-            prompts = json.loads(value_str)
-            
-            if not isinstance(prompts, list):
-                logger.warning(f"Expected list for {PROMPTS_KEY}, got {type(prompts)}")
-                return []
-            
-            return prompts
-        except json.JSONDecodeError as e:
-            logger.error(f"Failed to parse prompts JSON: {e}")
-            return []
-        except Exception as e:
-            logger.debug(f"Error reading prompts from ItemTable: {e}")
-            return []
+        """
+        Read generations newer than a timestamp from ItemTable.
+
+        Filtering and ordering run inside SQLite via json_each, so only new
+        generations are decoded in Python.
+
+        Args:
+            conn: Open Cursor database connection
+            since_ms: Only return generations with unixMs greater than this
+
+        Returns:
+            List of generation dicts sorted by unixMs ascending
+
+        Raises:
+            sqlite3.Error: If the query fails (e.g. database locked)
+        """
+        cursor = await conn.execute(NEW_GENERATIONS_QUERY, (GENERATIONS_KEY, since_ms))
+        rows = await cursor.fetchall()
+        await cursor.close()
+
+        generations = []
+        for (value,) in rows:
+            try:
+                generations.append(loads(value))
+            except json.JSONDecodeError as e:
+                logger.error(f"Failed to parse generation JSON: {e}")
+
+        return generations
 
     async def _capture_new_generations(
         self,
@@ -361,66 +377,85 @@ class CursorDatabaseMonitor:
         db_path: Path,
         last_timestamp_ms: int
     ):
-        """Capture new generations since last timestamp."""
+        """
+        Capture new generations since last timestamp.
+
+        Read and send errors propagate to _check_for_changes, which retries
+        locked databases and only records progress after a real success.
+        """
         conn = self.db_connections.get(workspace_hash)
         if not conn:
             return
 
-        try:
-            # Read generations array from ItemTable
-            all_generations = await self._get_generations_from_itemtable(conn)
-            
-            if not all_generations:
-                logger.debug(f"No generations found for {workspace_hash}")
-                return
-            
-            # Filter generations newer than last timestamp
-            new_generations = [
-                gen for gen in all_generations
-                if isinstance(gen, dict) and gen.get('unixMs', 0) > last_timestamp_ms
-            ]
-            
-            # Sort by timestamp
-            new_generations.sort(key=lambda g: g.get('unixMs', 0))
-            
-            logger.info(f"Found {len(new_generations)} new generations for {workspace_hash} (since {last_timestamp_ms})")
-            
-            # Update last synced timestamp
-            if new_generations:
-                max_timestamp = max(gen.get('unixMs', 0) for gen in new_generations)
-                self.last_synced_timestamp[workspace_hash] = max_timestamp
-            
-            # Process each generation
-            for gen in new_generations:
-                await self._process_generation(gen, workspace_hash, session_info)
+        # Read generations newer than last timestamp, sorted by unixMs
+        new_generations = await self._get_generations_from_itemtable(
+            conn, last_timestamp_ms
+        )
 
-        except asyncio.TimeoutError:
-            logger.warning(f"Query timeout capturing changes for {workspace_hash}")
-        except Exception as e:
-            logger.error(f"Error capturing changes: {e}")
+        if not new_generations:
+            logger.debug(f"No new generations found for {workspace_hash}")
+            return
 
-    async def _process_generation(
+        logger.info(f"Found {len(new_generations)} new generations for {workspace_hash} (since {last_timestamp_ms})")
+
+        # Send new generations, one pipeline round-trip per batch. Dedup keys
+        # are only marked seen once their batch is sent, so a failed batch
+        # is retried on the next poll instead of skipped as a duplicate
+        pipe = self.redis_client.pipeline(transaction=False)
+        pending_keys = []
+        queued = 0
+        for gen in new_generations:
+            entry = self._build_generation_entry(
+                gen, workspace_hash, session_info, pending_keys
+            )
+            if entry is None:
+                continue
+            pipe.xadd("telemetry:events", entry, maxlen=10000, approximate=True)
+            queued += 1
+            if len(pending_keys) == XADD_BATCH_SIZE:
+                pipe.execute()
+                self._mark_generations_seen(pending_keys)
+                pending_keys = []
+        if pending_keys:
+            pipe.execute()
+            self._mark_generations_seen(pending_keys)
+
+        # Update last synced timestamp once sent (results are sorted ascending)
+        self.last_synced_timestamp[workspace_hash] = new_generations[-1].get('unixMs', 0)
+
+        logger.debug(f"Captured {queued} generations for {workspace_hash}")
+
+    def _build_generation_entry(
         self,
         gen: dict,
         workspace_hash: str,
-        session_info: dict
-    ):
-        """Process generation with deduplication."""
+        session_info: dict,
+        pending_keys: list
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Build the Redis stream entry for a generation, with deduplication.
+
+        Args:
+            gen: Generation dict from aiService.generations
+            workspace_hash: Workspace the generation belongs to
+            session_info: Active session info for the workspace
+            pending_keys: Dedup keys queued in the current batch; the
+                generation's key is appended when an entry is returned
+
+        Returns:
+            Flat stream entry, or None if the generation is invalid or a duplicate
+        """
         # Extract generation UUID (actual field name is generationUUID)
         generation_id = gen.get("generationUUID")
         if not generation_id:
             logger.warning(f"Generation missing generationUUID: {gen}")
-            return
+            return None
 
-        # Deduplication check
+        # Deduplication check (sent generations and the unsent batch)
         dedup_key = (workspace_hash, generation_id)
-        if dedup_key in self.seen_generations:
+        if dedup_key in self.seen_generations or dedup_key in pending_keys:
             logger.debug(f"Skipping duplicate generation: {generation_id}")
-            return
-
-        # Mark as seen
-        self.seen_generations.add(dedup_key)
-        self.generation_ttl[dedup_key] = time.time()
+            return None
 
         try:
             # Extract timestamp (unixMs is in milliseconds, convert to ISO format)
@@ -466,21 +501,26 @@ class CursorDatabaseMonitor:
                 "payload": payload,
             }
 
-            # Send to Redis
-            self.redis_client.xadd(
-                "telemetry:events",
-                {
-                    k: json.dumps(v) if isinstance(v, (dict, list)) else str(v)
-                    for k, v in event.items()
-                },
-                maxlen=10000,
-                approximate=True
-            )
-
-            logger.debug(f"Captured generation: {generation_id}")
+            entry = {k: encode_stream_value(v) for k, v in event.items()}
 
         except Exception as e:
             logger.error(f"Error processing generation: {e}")
+            return None
+
+        pending_keys.append(dedup_key)
+        return entry
+
+    def _mark_generations_seen(self, dedup_keys: list) -> None:
+        """
+        Record sent generations in the deduplication cache.
+
+        Args:
+            dedup_keys: (workspace_hash, generation_id) keys of sent generations
+        """
+        now = time.time()
+        for dedup_key in dedup_keys:
+            self.seen_generations.add(dedup_key)
+            self.generation_ttl[dedup_key] = now
 
     async def _cleanup_dedup_cache(self):
         """Clean up old deduplication cache entries."""
@@ -511,6 +551,7 @@ class CursorDatabaseMonitor:
                 except:
                     pass
                 del self.db_connections[workspace_hash]
+            self.data_versions.pop(workspace_hash, None)
 
             # Clear health stats
             if workspace_hash in self.health_stats:
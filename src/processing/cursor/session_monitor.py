@@ -16,6 +16,9 @@ import redis
 
 logger = logging.getLogger(__name__)
 
+# Messages per XREAD while catching up on stream history
+HISTORY_PAGE_SIZE = 1000
+
 
 class SessionMonitor:
     """
@@ -52,20 +55,31 @@ class SessionMonitor:
     async def _catch_up_historical_events(self):
         """Process all historical session_start events from Redis."""
         try:
-            # Read all historical events
-            messages = self.redis_client.xread(
-                {"telemetry:events": "0-0"},
-                count=1000,
-                block=0  # Non-blocking
-            )
-
-            if messages:
+            # Page through all historical events. block=None sends no BLOCK
+            # argument: XREAD BLOCK 0 would wait forever on an empty stream.
+            processed = 0
+            while True:
+                messages = self.redis_client.xread(
+                    {"telemetry:events": self.last_redis_id},
+                    count=HISTORY_PAGE_SIZE,
+                    block=None
+                )
+                if not messages:
+                    break
+
+                page = 0
                 for stream, msgs in messages:
                     for msg_id, fields in msgs:
                         await self._process_redis_message(msg_id, fields)
                         self.last_redis_id = msg_id.decode() if isinstance(msg_id, bytes) else str(msg_id)
+                    page += len(msgs)
+
+                processed += page
+                if page < HISTORY_PAGE_SIZE:
+                    break
 
-                logger.info(f"Processed {len(msgs)} historical events")
+            if processed:
+                logger.info(f"Processed {processed} historical events")
         except Exception as e:
             logger.warning(f"Error catching up historical events: {e}")
 
@@ -91,7 +105,9 @@ class SessionMonitor:
                     )
 
                     if not messages:
-                        await asyncio.sleep(0.1)
+                        # XREAD already waited for the block timeout; just
+                        # yield so other tasks on this loop can run
+                        await asyncio.sleep(0)
                         continue
 
                     # Process messages
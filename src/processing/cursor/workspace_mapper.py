@@ -20,6 +20,26 @@ from .platform import get_cursor_database_paths
 
 logger = logging.getLogger(__name__)
 
+# ItemTable value (aliased i) as a JSON array for json_each; anything that
+# is not a valid array becomes '[]' so json_each yields no rows
+GENERATIONS_ARRAY_SQL = """
+    CASE WHEN json_valid(CAST(i.value AS TEXT))
+              AND json_type(CAST(i.value AS TEXT)) = 'array'
+         THEN CAST(i.value AS TEXT)
+         ELSE '[]'
+    END
+"""
+
+# Latest generation timestamp, computed inside SQLite so the (potentially
+# large) aiService.generations JSON array is never copied into Python.
+# Non-array or malformed values yield NULL instead of an error.
+MAX_GENERATION_TIMESTAMP_QUERY = """
+    SELECT MAX(CASE WHEN g.type = 'object' THEN json_extract(g.value, '$.unixMs') END)
+    FROM ItemTable AS i,
+         json_each({array}) AS g
+    WHERE i.key = 'aiService.generations'
+""".format(array=GENERATIONS_ARRAY_SQL)
+
 
 class WorkspaceMapper:
     """
@@ -130,7 +150,9 @@ class WorkspaceMapper:
     async def _db_contains_path(self, db_path: Path, workspace_path: str) -> bool:
         """Check if database contains workspace path reference."""
         try:
-            async with aiosqlite.connect(str(db_path), timeout=1.0) as conn:
+            async with aiosqlite.connect(
+                f"{db_path.resolve().as_uri()}?mode=ro", uri=True, timeout=1.0
+            ) as conn:
                 await conn.execute("PRAGMA read_uncommitted=1")
 
                 # Check various tables for workspace path
@@ -190,37 +212,22 @@ class WorkspaceMapper:
 
         for db_path in databases:
             try:
-                async with aiosqlite.connect(str(db_path), timeout=2.0) as conn:
+                async with aiosqlite.connect(
+                    f"{db_path.resolve().as_uri()}?mode=ro", uri=True, timeout=2.0
+                ) as conn:
                     await conn.execute("PRAGMA read_uncommitted=1")
 
-                    # Check if ItemTable has generations key
-                    cursor = await conn.execute('''
-                        SELECT value FROM ItemTable WHERE key = 'aiService.generations'
-                    ''')
+                    # Find max unixMs across generations (NULL if none)
+                    cursor = await conn.execute(MAX_GENERATION_TIMESTAMP_QUERY)
                     row = await cursor.fetchone()
-                    if not row or not row[0]:
+                    max_ts = row[0] if row else None
+                    if not isinstance(max_ts, (int, float)):
                         continue
 
-                    # Parse JSON array and find max timestamp
-                    try:
-                        value_str = row[0]
-                        if isinstance(value_str, bytes):
-                            value_str = value_str.decode('utf-8')
-                        generations = json.loads(value_str)
-                        
-                        if isinstance(generations, list) and len(generations) > 0:
-                            # Find max unixMs timestamp
-                            max_ts = max(
-                                (gen.get('unixMs', 0) for gen in generations if isinstance(gen, dict)),
-                                default=0
-                            )
-                            if max_ts > most_recent_timestamp:
-                                most_recent_timestamp = max_ts
-                                most_recent_db = db_path
-                                logger.debug(f"Found candidate database: {db_path} (timestamp: {max_ts})")
-                    except (json.JSONDecodeError, Exception) as e:
-                        logger.debug(f"Error parsing generations from {db_path}: {e}")
-                        continue
+                    if max_ts > most_recent_timestamp:
+                        most_recent_timestamp = max_ts
+                        most_recent_db = db_path
+                        logger.debug(f"Found candidate database: {db_path} (timestamp: {max_ts})")
             except Exception as e:
                 logger.debug(f"Error checking database {db_path}: {e}")
                 continue
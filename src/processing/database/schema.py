@@ -208,6 +208,7 @@ def create_indexes(client: SQLiteClient) -> None:
     """
     indexes = [
         "CREATE INDEX IF NOT EXISTS idx_session_time ON raw_traces(session_id, timestamp);",
+        "CREATE INDEX IF NOT EXISTS idx_session_seq ON raw_traces(session_id, sequence);",
         "CREATE INDEX IF NOT EXISTS idx_event_type_time ON raw_traces(event_type, timestamp);",
         "CREATE INDEX IF NOT EXISTS idx_date_hour ON raw_traces(event_date, event_hour);",
         "CREATE INDEX IF NOT EXISTS idx_timestamp ON raw_traces(timestamp DESC);",
@@ -233,16 +234,18 @@ def create_schema(client: SQLiteClient) -> None:
     """
     logger.info("Creating database schema...")
 
-    # Create tables
-    create_raw_traces_table(client)
-    create_conversations_table(client)
-    create_conversation_turns_table(client)
-    create_code_changes_table(client)
-    create_session_mappings_table(client)
-    create_trace_stats_table(client)
+    # Run all DDL in one transaction: a single commit instead of one per statement
+    with client.transaction():
+        # Create tables
+        create_raw_traces_table(client)
+        create_conversations_table(client)
+        create_conversation_turns_table(client)
+        create_code_changes_table(client)
+        create_session_mappings_table(client)
+        create_trace_stats_table(client)
 
-    # Create indexes
-    create_indexes(client)
+        # Create indexes
+        create_indexes(client)
 
     logger.info("Database schema created successfully")
 
@@ -285,18 +288,21 @@ def migrate_schema(client: SQLiteClient, from_version: int, to_version: int) ->
     """
     logger.info(f"Migrating schema from version {from_version} to {to_version}")
 
-    # Create schema_version table if it doesn't exist
-    client.execute(
-        """
-        CREATE TABLE IF NOT EXISTS schema_version (
-            version INTEGER PRIMARY KEY
-        );
-        """
-    )
+    with client.transaction():
+        # Create schema_version table if it doesn't exist
+        client.execute(
+            """
+            CREATE TABLE IF NOT EXISTS schema_version (
+                version INTEGER PRIMARY KEY
+            );
+            """
+        )
+
+        # For now, just recreate schema (future: add incremental migrations)
+        if from_version < to_version:
+            create_schema(client)
+            client.execute("INSERT OR REPLACE INTO schema_version (version) VALUES (?)", (to_version,))
 
-    # For now, just recreate schema (future: add incremental migrations)
     if from_version < to_version:
-        create_schema(client)
-        client.execute("INSERT OR REPLACE INTO schema_version (version) VALUES (?)", (to_version,))
         logger.info(f"Schema migrated to version {to_version}")
 
@@ -11,12 +11,26 @@ for high-throughput writes with WAL mode.
 
 import sqlite3
 import logging
+import threading
 from pathlib import Path
 from typing import Optional, ContextManager
 from contextlib import contextmanager
 
 logger = logging.getLogger(__name__)
 
+# Per-connection settings. Unlike journal_mode, these are not persisted in the
+# database file, so they must be applied to every new connection.
+CONNECTION_PRAGMAS = (
+    # Balance durability vs speed (NORMAL is good for WAL)
+    "PRAGMA synchronous=NORMAL",
+    # Set cache size to 64MB (negative value means KB)
+    "PRAGMA cache_size=-64000",
+    # Use memory for temporary tables
+    "PRAGMA temp_store=MEMORY",
+    # Enable mmap for faster reads (256MB)
+    "PRAGMA mmap_size=268435456",
+)
+
 
 class SQLiteClient:
     """
@@ -38,6 +52,19 @@ class SQLiteClient:
         """
         self.db_path = Path(db_path).expanduser()
         self._connection: Optional[sqlite3.Connection] = None
+        # Per-thread state: the connection owning this thread's active
+        # transaction() block, if any. The client is shared across threads,
+        # so one thread's transaction must not capture another's statements.
+        self._local = threading.local()
+
+    @property
+    def _transaction_conn(self) -> Optional[sqlite3.Connection]:
+        """Connection of the current thread's open transaction, if any."""
+        return getattr(self._local, "transaction_conn", None)
+
+    @_transaction_conn.setter
+    def _transaction_conn(self, conn: Optional[sqlite3.Connection]) -> None:
+        self._local.transaction_conn = conn
 
     def initialize_database(self) -> None:
         """
@@ -49,21 +76,16 @@ class SQLiteClient:
         # Open connection and configure
         conn = sqlite3.connect(str(self.db_path))
         try:
-            # Enable WAL mode for concurrent access
-            conn.execute("PRAGMA journal_mode=WAL")
-            
-            # Balance durability vs speed (NORMAL is good for WAL)
-            conn.execute("PRAGMA synchronous=NORMAL")
-            
-            # Set cache size to 64MB (negative value means KB)
-            conn.execute("PRAGMA cache_size=-64000")
-            
-            # Use memory for temporary tables
-            conn.execute("PRAGMA temp_store=MEMORY")
-            
-            # Enable mmap for faster reads (256MB)
-            conn.execute("PRAGMA mmap_size=268435456")
-            
+            # Enable WAL mode for concurrent access (persisted in the file)
+            journal_mode = conn.execute("PRAGMA journal_mode=WAL").fetchone()[0]
+            if journal_mode.lower() != "wal":
+                # e.g. network filesystems, where WAL is unsupported
+                logger.warning(
+                    f"WAL mode not enabled for {self.db_path} "
+                    f"(journal_mode={journal_mode}); concurrent readers may block writes"
+                )
+            self._configure_connection(conn)
+
             # Set foreign keys (for future conversation tables)
             conn.execute("PRAGMA foreign_keys=ON")
             
@@ -75,20 +97,66 @@ class SQLiteClient:
         finally:
             conn.close()
 
+    def _configure_connection(self, conn: sqlite3.Connection) -> None:
+        """
+        Apply per-connection PRAGMA settings.
+
+        Args:
+            conn: Newly opened connection
+        """
+        for pragma in CONNECTION_PRAGMAS:
+            conn.execute(pragma)
+
+    def connect(self, read_only: bool = False) -> sqlite3.Connection:
+        """
+        Open a new configured connection owned by the caller.
+
+        Use this for long-lived connections (e.g. the batch writer), so
+        that sqlite3's per-connection statement cache survives between
+        calls. The caller is responsible for closing it.
+
+        Args:
+            read_only: Open with mode=ro so the reader never takes write
+                locks or touches journal_mode (the database must already
+                be initialized in WAL mode)
+
+        Returns:
+            sqlite3.Connection configured with optimal settings
+        """
+        if read_only:
+            conn = sqlite3.connect(f"{self.db_path.resolve().as_uri()}?mode=ro", uri=True)
+        else:
+            conn = sqlite3.connect(str(self.db_path))
+        try:
+            if not read_only:
+                # Ensure WAL mode is enabled
+                conn.execute("PRAGMA journal_mode=WAL")
+            self._configure_connection(conn)
+        except Exception:
+            conn.close()
+            raise
+        return conn
+
     @contextmanager
-    def get_connection(self) -> ContextManager[sqlite3.Connection]:
+    def get_connection(self, read_only: bool = False) -> ContextManager[sqlite3.Connection]:
         """
         Get a database connection with context manager.
 
+        Inside a transaction() block, the transaction's connection is
+        yielded instead of opening a new one.
+
+        Args:
+            read_only: Open a read-only connection (see connect())
+
         Yields:
             sqlite3.Connection configured with optimal settings
         """
-        conn = sqlite3.connect(str(self.db_path))
+        if self._transaction_conn is not None:
+            yield self._transaction_conn
+            return
+
+        conn = self.connect(read_only=read_only)
         try:
-            # Ensure WAL mode is enabled
-            conn.execute("PRAGMA journal_mode=WAL")
-            conn.execute("PRAGMA synchronous=NORMAL")
-            conn.execute("PRAGMA cache_size=-64000")
             yield conn
         except Exception as e:
             conn.rollback()
@@ -97,6 +165,37 @@ class SQLiteClient:
         finally:
             conn.close()
 
+    @contextmanager
+    def transaction(self) -> ContextManager[sqlite3.Connection]:
+        """
+        Group multiple statements into a single write transaction.
+
+        While the block is active, execute(), executemany() and
+        get_connection() share one connection and skip their per-call
+        commits, so the whole group is committed (and fsynced) once.
+        Rolls back if the block raises. Nested blocks join the outer one.
+        The transaction is per thread: calls from other threads keep using
+        their own connections and commits.
+
+        Note: execute_script() always commits (sqlite3 executescript
+        semantics) and must not be used inside a transaction.
+
+        Yields:
+            sqlite3.Connection holding the open transaction
+        """
+        if self._transaction_conn is not None:
+            yield self._transaction_conn
+            return
+
+        with self.get_connection() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            self._transaction_conn = conn
+            try:
+                yield conn
+            finally:
+                self._transaction_conn = None
+            conn.commit()
+
     def execute(self, query: str, params: tuple = ()) -> None:
         """
         Execute a single query.
@@ -107,7 +206,8 @@ class SQLiteClient:
         """
         with self.get_connection() as conn:
             conn.execute(query, params)
-            conn.commit()
+            if self._transaction_conn is None:
+                conn.commit()
 
     def executemany(self, query: str, params: list[tuple]) -> None:
         """
@@ -119,7 +219,8 @@ class SQLiteClient:
         """
         with self.get_connection() as conn:
             conn.executemany(query, params)
-            conn.commit()
+            if self._transaction_conn is None:
+                conn.commit()
 
     def execute_script(self, script: str) -> None:
         """
@@ -9,12 +9,13 @@ Implements high-performance batch inserts with zlib compression.
 Target: <8ms P95 latency for 100 events.
 """
 
-import json
 import zlib
 import logging
+import sqlite3
 from typing import Dict, List, Any, Optional
 from datetime import datetime
 
+from ..json_codec import dumps, loads
 from .sqlite_client import SQLiteClient
 
 logger = logging.getLogger(__name__)
@@ -42,6 +43,8 @@ class SQLiteBatchWriter:
     - zlib compression (level 6) for event_data BLOB
     - Extracts indexed fields from event JSON
     - Zero reads - pure write path
+    - One long-lived connection, so the prepared INSERT is reused
+      from sqlite3's statement cache across batches
     """
 
     def __init__(self, client: SQLiteClient):
@@ -52,6 +55,25 @@ class SQLiteBatchWriter:
             client: SQLiteClient instance
         """
         self.client = client
+        # Opened lazily on first use, in the thread that writes
+        self._conn: Optional[sqlite3.Connection] = None
+
+    def _get_connection(self) -> sqlite3.Connection:
+        """
+        Get the writer's persistent connection, opening it if needed.
+
+        Returns:
+            sqlite3.Connection
+        """
+        if self._conn is None:
+            self._conn = self.client.connect()
+        return self._conn
+
+    def close(self) -> None:
+        """Close the writer's persistent connection."""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
 
     def _compress_event(self, event: Dict[str, Any]) -> bytes:
         """
@@ -63,8 +85,7 @@ class SQLiteBatchWriter:
         Returns:
             Compressed bytes
         """
-        json_str = json.dumps(event, separators=(',', ':'))
-        return zlib.compress(json_str.encode('utf-8'), COMPRESSION_LEVEL)
+        return zlib.compress(dumps(event), COMPRESSION_LEVEL)
 
     def _extract_indexed_fields(self, event: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -160,28 +181,32 @@ class SQLiteBatchWriter:
             rows.append(row)
 
         # Batch insert
+        conn = self._get_connection()
         try:
+            # Take the write lock up front so lock contention surfaces (and is
+            # retried by the busy handler) before any work is done
+            conn.execute("BEGIN IMMEDIATE")
+
             # Use a single connection for both insert and sequence retrieval
-            with self.client.get_connection() as conn:
-                # Insert batch
-                conn.executemany(INSERT_QUERY, rows)
+            conn.executemany(INSERT_QUERY, rows)
 
-                # Get sequence numbers immediately after insert (same connection)
-                cursor = conn.execute("SELECT last_insert_rowid()")
-                last_rowid = cursor.fetchone()[0]
+            # Get sequence numbers immediately after insert (same connection)
+            cursor = conn.execute("SELECT last_insert_rowid()")
+            last_rowid = cursor.fetchone()[0]
 
-                # Calculate sequence numbers: if we inserted N rows, sequences are
-                # last_rowid - (N-1) through last_rowid
-                sequences = list(range(last_rowid - len(rows) + 1, last_rowid + 1))
+            # Calculate sequence numbers: if we inserted N rows, sequences are
+            # last_rowid - (N-1) through last_rowid
+            sequences = list(range(last_rowid - len(rows) + 1, last_rowid + 1))
 
-                # Commit the transaction
-                conn.commit()
+            # Commit the transaction
+            conn.commit()
 
             logger.debug(f"Wrote batch of {len(events)} events, sequences: {sequences[0]}-{sequences[-1]}")
             
             return sequences
 
         except Exception as e:
+            conn.rollback()
             logger.error(f"Failed to write batch: {e}", exc_info=True)
             raise
 
@@ -200,17 +225,15 @@ class SQLiteBatchWriter:
         Returns:
             Decompressed event dictionary or None if not found
         """
-        with self.client.get_connection() as conn:
-            cursor = conn.execute(
+        with self.client.get_connection(read_only=True) as conn:
+            row = conn.execute(
                 "SELECT event_data FROM raw_traces WHERE sequence = ?",
                 (sequence,)
-            )
-            row = cursor.fetchone()
+            ).fetchone()
             if not row:
                 return None
 
-            # Decompress and parse
-            compressed_data = row[0]
-            json_str = zlib.decompress(compressed_data).decode('utf-8')
-            return json.loads(json_str)
+            # Decompress and parse (both parsers accept bytes directly)
+            data = zlib.decompress(row[0])
+            return loads(data)
 
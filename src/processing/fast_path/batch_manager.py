@@ -10,22 +10,13 @@ Manages batching logic: size-based and time-based flushing.
 
 import time
 import threading
-from dataclasses import dataclass
 from typing import Dict, List, Any, Optional, Tuple, Iterable
-from collections import deque
 
 import logging
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
-class BatchItem:
-    event: Dict[str, Any]
-    message_id: str
-    added_at: float
-
-
 class BatchManager:
     """
     Manages event batching for efficient writes.
@@ -47,8 +38,12 @@ class BatchManager:
         """
         self.batch_size = batch_size
         self.batch_timeout = batch_timeout
-        # Store BatchItem entries to preserve metadata for ACK handling
-        self._batch_items: deque[BatchItem] = deque()
+        # Parallel columns (same index = same item) so get_batch() can hand
+        # the lists over without a per-item copy; message IDs are kept for
+        # ACK handling
+        self._events: List[Dict[str, Any]] = []
+        self._message_ids: List[str] = []
+        self._added_at: List[float] = []
         self._lock = threading.Lock()
         self._first_event_time: Optional[float] = None
 
@@ -65,13 +60,15 @@ class BatchManager:
         """
         with self._lock:
             now = time.time()
-            if len(self._batch_items) == 0:
+            if not self._events:
                 self._first_event_time = now
 
-            self._batch_items.append(BatchItem(event=event, message_id=message_id, added_at=now))
+            self._events.append(event)
+            self._message_ids.append(message_id)
+            self._added_at.append(now)
 
             # Check if batch is full
-            if len(self._batch_items) >= self.batch_size:
+            if len(self._events) >= self.batch_size:
                 return True
 
             return False
@@ -84,21 +81,20 @@ class BatchManager:
             Tuple of (events, message_ids) - both lists in same order
         """
         with self._lock:
-            events = []
-            message_ids = []
-            while self._batch_items:
-                item = self._batch_items.popleft()
-                events.append(item.event)
-                message_ids.append(item.message_id)
-            
-            self._batch_items.clear()
+            events = self._events
+            message_ids = self._message_ids
+            self._events = []
+            self._message_ids = []
+            self._added_at = []
             self._first_event_time = None
             return events, message_ids
 
     def clear(self) -> None:
         """Clear current batch."""
         with self._lock:
-            self._batch_items.clear()
+            self._events = []
+            self._message_ids = []
+            self._added_at = []
             self._first_event_time = None
 
     def remove_message_ids(self, message_ids: Iterable[str]) -> None:
@@ -113,14 +109,16 @@ class BatchManager:
             return
 
         with self._lock:
-            if not self._batch_items:
+            if not self._events:
                 return
 
-            filtered_items = deque(item for item in self._batch_items if item.message_id not in ids)
-            self._batch_items = filtered_items
+            keep = [i for i, message_id in enumerate(self._message_ids) if message_id not in ids]
+            self._events = [self._events[i] for i in keep]
+            self._message_ids = [self._message_ids[i] for i in keep]
+            self._added_at = [self._added_at[i] for i in keep]
 
-            if self._batch_items:
-                self._first_event_time = self._batch_items[0].added_at
+            if self._added_at:
+                self._first_event_time = self._added_at[0]
             else:
                 self._first_event_time = None
 
@@ -132,7 +130,7 @@ class BatchManager:
             True if timeout exceeded, False otherwise
         """
         with self._lock:
-            if len(self._batch_items) == 0:
+            if not self._events:
                 return False
 
             if self._first_event_time is None:
@@ -149,7 +147,7 @@ class BatchManager:
             Number of events in current batch
         """
         with self._lock:
-            return len(self._batch_items)
+            return len(self._events)
 
     def is_empty(self) -> bool:
         """
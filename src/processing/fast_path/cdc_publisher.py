@@ -10,7 +10,7 @@ Publishes events to Redis Streams for async worker processing.
 
 import json
 import logging
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 import redis
 
 logger = logging.getLogger(__name__)
@@ -69,29 +69,42 @@ class CDCPublisher:
         else:
             return 5
 
-    def publish(self, sequence: int, event: Dict[str, Any], priority: Optional[int] = None) -> None:
+    def _build_cdc_event(self, sequence: int, event: Dict[str, Any], priority: Optional[int] = None) -> Dict[str, Any]:
         """
-        Publish CDC event to Redis Stream (fire-and-forget).
+        Build the CDC stream entry for an event.
 
         Args:
             sequence: Sequence number from SQLite
             event: Event dictionary
             priority: Priority level (calculated if not provided)
+
+        Returns:
+            CDC event dictionary
         """
         if priority is None:
             priority = self._calculate_priority(event)
 
+        return {
+            'sequence': sequence,
+            'event_id': event.get('event_id', ''),
+            'session_id': event.get('session_id', ''),
+            'event_type': event.get('event_type', ''),
+            'platform': event.get('platform', ''),
+            'timestamp': event.get('timestamp', ''),
+            'priority': priority,
+        }
+
+    def publish(self, sequence: int, event: Dict[str, Any], priority: Optional[int] = None) -> None:
+        """
+        Publish CDC event to Redis Stream (fire-and-forget).
+
+        Args:
+            sequence: Sequence number from SQLite
+            event: Event dictionary
+            priority: Priority level (calculated if not provided)
+        """
         try:
-            # Build CDC event
-            cdc_event = {
-                'sequence': sequence,
-                'event_id': event.get('event_id', ''),
-                'session_id': event.get('session_id', ''),
-                'event_type': event.get('event_type', ''),
-                'platform': event.get('platform', ''),
-                'timestamp': event.get('timestamp', ''),
-                'priority': priority,
-            }
+            cdc_event = self._build_cdc_event(sequence, event, priority)
 
             # Publish to stream with auto-trim
             self.redis_client.xadd(
@@ -101,9 +114,36 @@ class CDCPublisher:
                 approximate=True
             )
 
-            logger.debug(f"Published CDC event: sequence={sequence}, priority={priority}")
+            logger.debug(f"Published CDC event: sequence={sequence}, priority={cdc_event['priority']}")
 
         except Exception as e:
             # Log but don't block - CDC failures don't affect fast path
             logger.warning(f"Failed to publish CDC event: {e}")
 
+    def publish_batch(self, sequences: List[int], events: List[Dict[str, Any]]) -> None:
+        """
+        Publish CDC events for a batch in a single pipeline (fire-and-forget).
+
+        Args:
+            sequences: Sequence numbers from SQLite
+            events: Event dictionaries, in the same order as sequences
+        """
+        if not events:
+            return
+
+        try:
+            pipe = self.redis_client.pipeline(transaction=False)
+            for sequence, event in zip(sequences, events):
+                pipe.xadd(
+                    self.stream_name,
+                    self._build_cdc_event(sequence, event),
+                    maxlen=self.max_length,
+                    approximate=True
+                )
+            pipe.execute()
+
+            logger.debug(f"Published {len(events)} CDC events: sequences {sequences[0]}-{sequences[-1]}")
+
+        except Exception as e:
+            # Log but don't block - CDC failures don't affect fast path
+            logger.warning(f"Failed to publish CDC batch: {e}")
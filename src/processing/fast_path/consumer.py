@@ -11,17 +11,29 @@ and publishes CDC events for slow path workers.
 
 import json
 import logging
+import sys
 import time
 from typing import Dict, List, Any, Optional, Set
 from collections import deque
 import redis
 
+from ..json_codec import loads
 from .batch_manager import BatchManager
 from .cdc_publisher import CDCPublisher
 from ..database.writer import SQLiteBatchWriter
 
 logger = logging.getLogger(__name__)
 
+# Low-cardinality string fields whose values repeat across most messages;
+# interned so every event shares one string object per distinct value.
+INTERNED_FIELDS = frozenset({
+    "platform", "event_type", "hook_type", "session_id", "external_session_id",
+})
+
+# Upper bound on cached decoded field names (stream entries use a small,
+# fixed set of keys; the cap only guards against malformed producers).
+MAX_FIELD_NAME_CACHE = 256
+
 
 class FastPathConsumer:
     """
@@ -77,6 +89,8 @@ class FastPathConsumer:
         self.max_retries = max_retries
         self.running = False
         self.dlq_stream = "telemetry:dlq"
+        # Raw stream field name -> decoded, interned str
+        self._field_names: Dict[Any, str] = {}
         
         # Backpressure handling
         self.current_batch_size = batch_size  # Adaptive batch size
@@ -115,21 +129,26 @@ class FastPathConsumer:
         """
         try:
             event: Dict[str, Any] = {}
+            field_names = self._field_names
 
             for key, value in fields.items():
-                key_str = key.decode("utf-8") if isinstance(key, bytes) else str(key)
-                if isinstance(value, bytes):
-                    val_str = value.decode("utf-8")
-                else:
-                    val_str = str(value)
+                key_str = field_names.get(key)
+                if key_str is None:
+                    key_str = sys.intern(key.decode("utf-8") if isinstance(key, bytes) else str(key))
+                    if len(field_names) < MAX_FIELD_NAME_CACHE:
+                        field_names[key] = key_str
 
                 if key_str in ("payload", "metadata"):
+                    # Parsed from the raw bytes (no decode step)
                     try:
-                        event[key_str] = json.loads(val_str)
-                    except json.JSONDecodeError:
+                        event[key_str] = loads(value)
+                    except (json.JSONDecodeError, UnicodeDecodeError):
                         event[key_str] = {}
                 else:
-                    event[key_str] = val_str
+                    value_str = value.decode("utf-8") if isinstance(value, bytes) else str(value)
+                    if key_str in INTERNED_FIELDS:
+                        value_str = sys.intern(value_str)
+                    event[key_str] = value_str
 
             if "event_id" not in event:
                 event["event_id"] = message_id
@@ -271,9 +290,8 @@ class FastPathConsumer:
             # Track write latency for backpressure
             self.write_times.append(write_duration)
             
-            # Publish CDC events
-            for sequence, event in zip(sequences, events):
-                self.cdc_publisher.publish(sequence, event)
+            # Publish CDC events (one round-trip for the whole batch)
+            self.cdc_publisher.publish_batch(sequences, events)
 
             logger.debug(f"Processed batch: {len(events)} events, sequences {sequences[0]}-{sequences[-1]}, duration: {write_duration:.3f}s")
             
@@ -466,20 +484,20 @@ class FastPathConsumer:
                     logger.error(f"Failed to claim DLQ candidates: {claim_error}")
                     claimed_dlq = []
 
+                dlq_ids = []
                 for msg_id, fields in claimed_dlq:
                     msg_id_str = msg_id.decode('utf-8') if isinstance(msg_id, bytes) else str(msg_id)
                     event = self._decode_stream_message(msg_id_str, fields)
                     retry_count = dlq_candidates.get(msg_id_str, self.max_retries)
 
                     self._handle_failed_message(msg_id_str, event, retry_count=retry_count)
+                    dlq_ids.append(msg_id_str)
 
-                    try:
-                        self.redis_client.xack(self.stream_name, self.consumer_group, msg_id_str)
-                    except Exception as ack_error:
-                        logger.error(f"Failed to ACK DLQ message {msg_id_str}: {ack_error}")
+                # ACK all DLQ'd messages at once
+                self._ack_messages(dlq_ids)
 
-                    # Ensure duplicates aren't processed later
-                    self.batch_manager.remove_message_ids([msg_id_str])
+                # Ensure duplicates aren't processed later
+                self.batch_manager.remove_message_ids(dlq_ids)
 
             # First, always try to read pending messages directly assigned to this consumer
             # This is the most efficient way to process them
@@ -507,11 +525,9 @@ class FastPathConsumer:
                 # Send messages that exceeded retries to DLQ
                 for msg_id, event, delivery_count in dlq_from_direct:
                     self._handle_failed_message(msg_id, event, retry_count=delivery_count)
-                    try:
-                        self.redis_client.xack(self.stream_name, self.consumer_group, msg_id)
-                    except Exception as ack_error:
-                        logger.error(f"Failed to ACK DLQ message {msg_id}: {ack_error}")
-                    self.batch_manager.remove_message_ids([msg_id])
+                dlq_ids = [msg_id for msg_id, _, _ in dlq_from_direct]
+                self._ack_messages(dlq_ids)
+                self.batch_manager.remove_message_ids(dlq_ids)
                 
                 # Process remaining messages
                 if messages_to_process:
@@ -540,6 +556,7 @@ class FastPathConsumer:
 
                     if claimed_retry:
                         messages = []
+                        malformed_ids = []
                         for msg_id, fields in claimed_retry:
                             msg_id_str = msg_id.decode('utf-8') if isinstance(msg_id, bytes) else str(msg_id)
                             event = self._decode_stream_message(msg_id_str, fields)
@@ -547,15 +564,14 @@ class FastPathConsumer:
                             if event is None:
                                 # Unparseable event - send to DLQ immediately
                                 self._handle_failed_message(msg_id_str, event, retry_count=self.max_retries)
-                                try:
-                                    self.redis_client.xack(self.stream_name, self.consumer_group, msg_id_str)
-                                except Exception as ack_error:
-                                    logger.error(f"Failed to ACK malformed message {msg_id_str}: {ack_error}")
-                                self.batch_manager.remove_message_ids([msg_id_str])
+                                malformed_ids.append(msg_id_str)
                                 continue
 
                             messages.append({'id': msg_id_str, 'event': event})
 
+                        self._ack_messages(malformed_ids)
+                        self.batch_manager.remove_message_ids(malformed_ids)
+
                         if messages:
                             processed_ids = self._process_batch(messages)
                             if processed_ids:
@@ -668,6 +684,7 @@ class FastPathConsumer:
                 logger.error(f"Error in consumer loop: {e}", exc_info=True)
                 time.sleep(1)  # Back off on error
 
+        self.sqlite_writer.close()
         logger.info("Fast path consumer stopped")
 
     def stop(self) -> None:
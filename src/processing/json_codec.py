@@ -0,0 +1,78 @@
+# Copyright © 2025 Sierra Labs LLC
+# SPDX-License-Identifier: AGPL-3.0-only
+# License-Filename: LICENSE
+
+"""
+JSON encoding helpers for the processing layer.
+
+Uses orjson when it is installed and falls back to the stdlib json module
+for environments without it and for values orjson rejects.
+"""
+
+import json
+from typing import Any
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def dumps(value: Any) -> bytes:
+    """
+    Serialize a value to compact UTF-8 JSON.
+
+    Args:
+        value: JSON-serializable value
+
+    Returns:
+        JSON document as bytes
+    """
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            # Values orjson can't serialize (e.g. >64-bit ints) - use stdlib
+            pass
+    return json.dumps(value, separators=(',', ':')).encode('utf-8')
+
+
+def encode_stream_value(value: Any) -> Any:
+    """
+    Encode one stream entry value (Redis Streams values are flat strings).
+
+    Args:
+        value: Field value; dicts and lists are serialized to JSON
+
+    Returns:
+        JSON bytes for containers, str() of anything else
+    """
+    if isinstance(value, (dict, list)):
+        return dumps(value)
+    return str(value)
+
+
+def loads(data: Any) -> Any:
+    """
+    Parse a JSON document from bytes or str.
+
+    orjson rejects some input the stdlib accepts (e.g. NaN/Infinity written
+    by json.dumps producers), so its failures are retried with json.loads.
+
+    Args:
+        data: JSON document as bytes or str
+
+    Returns:
+        Parsed value
+
+    Raises:
+        json.JSONDecodeError: If the document is not valid JSON
+        UnicodeDecodeError: If bytes are not valid UTF-8
+    """
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(data)
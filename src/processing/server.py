@@ -204,12 +204,18 @@ class TelemetryServer:
                     loop = asyncio.new_event_loop()
                     asyncio.set_event_loop(loop)
                     loop.run_until_complete(self.session_monitor.start())
+                    # start() only schedules the monitor's tasks; keep the
+                    # loop running so they make progress
+                    loop.run_forever()
                 
                 def run_cursor_monitor():
                     import asyncio
                     loop = asyncio.new_event_loop()
                     asyncio.set_event_loop(loop)
                     loop.run_until_complete(self.cursor_monitor.start())
+                    # start() only schedules the monitor's tasks; keep the
+                    # loop running so they make progress
+                    loop.run_forever()
                 
                 session_thread = threading.Thread(target=run_session_monitor, daemon=True)
                 cursor_thread = threading.Thread(target=run_cursor_monitor, daemon=True)
@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+# Copyright © 2025 Sierra Labs LLC
+# SPDX-License-Identifier: AGPL-3.0-only
+# License-Filename: LICENSE
+
+"""Test generation capture in the Cursor database monitor."""
+
+import asyncio
+import json
+import sys
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import aiosqlite
+
+# Add project to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from src.processing.cursor import database_monitor
+from src.processing.cursor.database_monitor import CursorDatabaseMonitor, GENERATIONS_KEY
+
+
+def _make_monitor(fail_sends: int = 0):
+    """Monitor with a mocked Redis client; the first fail_sends executes raise."""
+    redis_client = MagicMock()
+    sent = []
+    failures = {"remaining": fail_sends}
+
+    def pipeline(transaction=True):
+        pipe = MagicMock()
+        batch = []
+        pipe.xadd.side_effect = lambda stream, fields, **kwargs: batch.append(fields)
+
+        def execute():
+            if failures["remaining"]:
+                failures["remaining"] -= 1
+                batch.clear()
+                raise ConnectionError("redis down")
+            sent.extend(batch)
+            batch.clear()
+            return []
+
+        pipe.execute.side_effect = execute
+        return pipe
+
+    redis_client.pipeline.side_effect = pipeline
+    monitor = CursorDatabaseMonitor(redis_client, MagicMock(), max_retries=1)
+    return monitor, sent
+
+
+async def _open_cursor_db(count: int) -> aiosqlite.Connection:
+    generations = [
+        {"generationUUID": f"g{n}", "unixMs": 1000 + n, "type": "composer"}
+        for n in range(1, count + 1)
+    ]
+    conn = await aiosqlite.connect(":memory:")
+    await conn.execute("CREATE TABLE ItemTable (key TEXT PRIMARY KEY, value BLOB)")
+    await conn.execute(
+        "INSERT INTO ItemTable (key, value) VALUES (?, ?)",
+        (GENERATIONS_KEY, json.dumps(generations).encode()),
+    )
+    await conn.commit()
+    return conn
+
+
+async def _check_twice(monitor, count: int) -> list:
+    """Run two polls; return last_synced_timestamp after each."""
+    conn = await _open_cursor_db(count)
+    monitor.db_connections["w"] = conn
+    session_info = {"session_id": "s1"}
+    try:
+        synced = []
+        for _ in range(2):
+            await monitor._check_for_changes("w", session_info, Path("state.vscdb"))
+            synced.append(monitor.last_synced_timestamp.get("w"))
+        return synced
+    finally:
+        await conn.close()
+
+
+def _generation_ids(sent: list) -> list:
+    return [json.loads(fields["payload"])["generation_id"] for fields in sent]
+
+
+def test_failed_send_is_retried():
+    """Generations from a failed send are sent on the next poll."""
+    monitor, sent = _make_monitor(fail_sends=1)
+
+    synced = asyncio.run(_check_twice(monitor, 3))
+
+    assert synced == [None, 1003]
+    assert _generation_ids(sent) == ["g1", "g2", "g3"]
+    assert monitor.data_versions.get("w") is not None
+
+
+def test_failed_later_batch_is_retried():
+    """Only the unsent batch is resent after a later batch fails."""
+    monitor, sent = _make_monitor()
+    original_batch_size = database_monitor.XADD_BATCH_SIZE
+    database_monitor.XADD_BATCH_SIZE = 2
+    try:
+        pipeline = monitor.redis_client.pipeline.side_effect
+        calls = {"n": 0}
+
+        def failing_pipeline(transaction=True):
+            pipe = pipeline(transaction)
+            execute = pipe.execute.side_effect
+
+            def execute_second_fails():
+                calls["n"] += 1
+                if calls["n"] == 2:
+                    raise ConnectionError("redis down")
+                return execute()
+
+            pipe.execute.side_effect = execute_second_fails
+            return pipe
+
+        monitor.redis_client.pipeline.side_effect = failing_pipeline
+        synced = asyncio.run(_check_twice(monitor, 3))
+    finally:
+        database_monitor.XADD_BATCH_SIZE = original_batch_size
+
+    assert synced == [None, 1003]
+    assert _generation_ids(sent) == ["g1", "g2", "g3"]
+
+
+def test_seen_generations_are_skipped():
+    """A generation already sent is not sent again."""
+    monitor, sent = _make_monitor()
+    monitor.seen_generations.add(("w", "g2"))
+
+    asyncio.run(_check_twice(monitor, 3))
+
+    assert _generation_ids(sent) == ["g1", "g3"]
+
+
+if __name__ == '__main__':
+    test_failed_send_is_retried()
+    test_failed_later_batch_is_retried()
+    test_seen_generations_are_skipped()
+    print("✅ All tests passed!")
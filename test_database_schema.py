@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+# Copyright © 2025 Sierra Labs LLC
+# SPDX-License-Identifier: AGPL-3.0-only
+# License-Filename: LICENSE
+
+"""Test SQLite client transactions and schema creation."""
+
+import sqlite3
+import sys
+import tempfile
+import threading
+from pathlib import Path
+
+# Add project to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from src.processing.database.sqlite_client import SQLiteClient
+from src.processing.database.schema import create_schema
+
+
+def _make_client(tmpdir: str) -> SQLiteClient:
+    client = SQLiteClient(str(Path(tmpdir) / "telemetry.db"))
+    client.initialize_database()
+    return client
+
+
+def _table_names(client: SQLiteClient) -> set:
+    with client.get_connection() as conn:
+        cursor = conn.execute("SELECT name FROM sqlite_master WHERE type='table'")
+        return {row[0] for row in cursor}
+
+
+def test_create_schema():
+    """Schema creation produces all tables in one transaction."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        client = _make_client(tmpdir)
+        create_schema(client)
+
+        tables = _table_names(client)
+        for table in ("raw_traces", "conversations", "conversation_turns",
+                      "code_changes", "session_mappings", "trace_stats"):
+            assert table in tables, f"{table} not created"
+
+        # Running again is a no-op
+        create_schema(client)
+
+
+def test_transaction_commits_at_block_end():
+    """Statements inside transaction() are committed together."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        client = _make_client(tmpdir)
+        client.execute("CREATE TABLE t (x INTEGER)")
+
+        with client.transaction() as conn:
+            client.execute("INSERT INTO t (x) VALUES (?)", (1,))
+            client.executemany("INSERT INTO t (x) VALUES (?)", [(2,), (3,)])
+
+            # Not yet visible to other connections
+            other = sqlite3.connect(str(client.db_path))
+            try:
+                assert other.execute("SELECT COUNT(*) FROM t").fetchone()[0] == 0
+            finally:
+                other.close()
+
+        with client.get_connection() as conn:
+            assert conn.execute("SELECT COUNT(*) FROM t").fetchone()[0] == 3
+
+
+def test_transaction_is_per_thread():
+    """Statements from another thread are not captured by an open transaction."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        client = _make_client(tmpdir)
+        client.execute("CREATE TABLE t (x INTEGER)")
+        seen = []
+
+        def other_thread():
+            seen.append(client._transaction_conn)
+
+        with client.transaction():
+            worker = threading.Thread(target=other_thread)
+            worker.start()
+            worker.join()
+            assert client._transaction_conn is not None
+
+        assert seen == [None]
+
+
+def test_transaction_rolls_back_on_error():
+    """An exception inside transaction() discards all its statements."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        client = _make_client(tmpdir)
+        client.execute("CREATE TABLE t (x INTEGER)")
+
+        try:
+            with client.transaction():
+                client.execute("INSERT INTO t (x) VALUES (?)", (1,))
+                raise ValueError("boom")
+        except ValueError:
+            pass
+
+        with client.get_connection() as conn:
+            assert conn.execute("SELECT COUNT(*) FROM t").fetchone()[0] == 0
+
+
+def test_read_only_connection():
+    """Read-only connections can query but not write."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        client = _make_client(tmpdir)
+        client.execute("CREATE TABLE t (x INTEGER)")
+        client.execute("INSERT INTO t (x) VALUES (?)", (1,))
+
+        with client.get_connection(read_only=True) as conn:
+            assert conn.execute("SELECT COUNT(*) FROM t").fetchone()[0] == 1
+            try:
+                conn.execute("INSERT INTO t (x) VALUES (2)")
+                assert False, "write succeeded on read-only connection"
+            except sqlite3.OperationalError:
+                pass
+
+
+if __name__ == '__main__':
+    test_create_schema()
+    test_transaction_commits_at_block_end()
+    test_transaction_is_per_thread()
+    test_transaction_rolls_back_on_error()
+    test_read_only_connection()
+    print("✅ All tests passed!")
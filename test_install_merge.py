@@ -9,7 +9,7 @@ import sys
 # Add project to path
 sys.path.insert(0, str(Path(__file__).parent))
 
-from scripts.install_claude_code import update_settings_json
+from scripts.install_claude_code import update_settings_json, _sync_tree
 
 
 def test_merge_with_existing_hooks():
@@ -172,6 +172,35 @@ def test_merge_with_existing_hooks():
             Path.home = staticmethod(original_home)
 
 
+def test_sync_tree_copies_only_changes():
+    """Test that shared module sync skips unchanged files and prunes stale ones."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        source = Path(tmpdir) / "src"
+        target = Path(tmpdir) / "dst"
+        (source / "pkg").mkdir(parents=True)
+        (source / "a.py").write_text("a = 1\n")
+        (source / "pkg" / "b.py").write_text("b = 2\n")
+        (source / "__pycache__").mkdir()
+        (source / "__pycache__" / "a.pyc").write_bytes(b"\0")
+
+        assert _sync_tree(source, target) == 2
+        assert not (target / "__pycache__").exists()
+
+        # Second run copies nothing
+        assert _sync_tree(source, target) == 0
+
+        # Changed and stale files are handled
+        (target / "a.py").write_text("tampered\n")
+        (target / "stale.py").write_text("old\n")
+        (target / "old_pkg").mkdir()
+        assert _sync_tree(source, target) == 1
+        assert (target / "a.py").read_text() == "a = 1\n"
+        assert not (target / "stale.py").exists()
+        assert not (target / "old_pkg").exists()
+        assert (target / "pkg" / "b.py").read_text() == "b = 2\n"
+    return True
+
+
 if __name__ == '__main__':
-    success = test_merge_with_existing_hooks()
+    success = test_merge_with_existing_hooks() and test_sync_tree_copies_only_changes()
     sys.exit(0 if success else 1)
@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+# Copyright © 2025 Sierra Labs LLC
+# SPDX-License-Identifier: AGPL-3.0-only
+# License-Filename: LICENSE
+
+"""Test incremental transcript reads in the Claude Code transcript monitor."""
+
+import asyncio
+import json
+import sys
+import tempfile
+from pathlib import Path
+from unittest.mock import MagicMock
+
+# Add project to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from src.processing.claude_code import transcript_monitor
+from src.processing.claude_code.transcript_monitor import ClaudeCodeTranscriptMonitor
+
+
+def _make_monitor(fail_sends: int = 0):
+    """Monitor with a mocked Redis client; the first fail_sends batches raise."""
+    redis_client = MagicMock()
+    sent = []
+    failures = {"remaining": fail_sends}
+
+    def pipeline(transaction=True):
+        pipe = MagicMock()
+        batch = []
+        pipe.xadd.side_effect = lambda stream, fields, **kwargs: batch.append(fields)
+
+        def execute():
+            if failures["remaining"]:
+                failures["remaining"] -= 1
+                raise ConnectionError("redis down")
+            sent.extend(batch)
+            return [b"0-1"] * len(batch)
+
+        pipe.execute.side_effect = execute
+        return pipe
+
+    redis_client.pipeline.side_effect = pipeline
+    return ClaudeCodeTranscriptMonitor(redis_client), sent
+
+
+def _append(path: Path, text: str) -> None:
+    with open(path, "a", encoding="utf-8") as f:
+        f.write(text)
+
+
+def _line(n: int) -> str:
+    return json.dumps({"type": "user", "uuid": f"u{n}"}) + "\n"
+
+
+def _process(monitor, path: Path) -> None:
+    asyncio.run(monitor._process_transcript("s1", str(path)))
+
+
+def _state(monitor) -> dict:
+    return next(iter(monitor.transcript_state.values()))
+
+
+def test_incremental_reads():
+    """Only entries appended since the last pass are sent."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = Path(tmpdir) / "t.jsonl"
+        monitor, sent = _make_monitor()
+
+        _append(path, _line(1) + _line(2))
+        _process(monitor, path)
+        assert len(sent) == 2
+
+        _process(monitor, path)
+        assert len(sent) == 2
+
+        _append(path, _line(3))
+        _process(monitor, path)
+        assert len(sent) == 3
+        assert _state(monitor)["offset"] == path.stat().st_size
+        assert _state(monitor)["entries"] == 3
+
+
+def test_partial_line_waits_for_newline():
+    """A trailing line without a newline is left for the next pass."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = Path(tmpdir) / "t.jsonl"
+        monitor, sent = _make_monitor()
+
+        partial = _line(2)
+        _append(path, _line(1) + partial[:10])
+        _process(monitor, path)
+        assert len(sent) == 1
+        assert _state(monitor)["offset"] == len(_line(1))
+
+        _append(path, partial[10:])
+        _process(monitor, path)
+        assert len(sent) == 2
+
+
+def test_rewritten_transcript_is_reread():
+    """A transcript replaced with different content is read from the start."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = Path(tmpdir) / "t.jsonl"
+        monitor, sent = _make_monitor()
+
+        _append(path, _line(1) + _line(2))
+        _process(monitor, path)
+        assert len(sent) == 2
+
+        path.write_text(_line(7) + _line(8) + _line(9), encoding="utf-8")
+        _process(monitor, path)
+        assert len(sent) == 5
+        assert _state(monitor)["offset"] == path.stat().st_size
+
+
+def test_failed_send_does_not_advance():
+    """Entries from a failed batch are sent again on the next pass."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = Path(tmpdir) / "t.jsonl"
+        monitor, sent = _make_monitor(fail_sends=1)
+
+        _append(path, _line(1) + _line(2))
+        _process(monitor, path)
+        assert sent == []
+        assert monitor.transcript_state == {}
+
+        _process(monitor, path)
+        assert len(sent) == 2
+        assert _state(monitor)["entries"] == 2
+
+
+def test_failed_later_batch_keeps_earlier_progress():
+    """Progress stops after the last batch that was actually sent."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = Path(tmpdir) / "t.jsonl"
+        monitor, sent = _make_monitor()
+        original_batch_size = transcript_monitor.XADD_BATCH_SIZE
+        transcript_monitor.XADD_BATCH_SIZE = 2
+        try:
+            _append(path, "".join(_line(n) for n in range(1, 6)))
+            calls = {"n": 0}
+            send = monitor._send_transcript_entries
+
+            def fail_second(*args):
+                calls["n"] += 1
+                return send(*args) if calls["n"] != 2 else False
+
+            monitor._send_transcript_entries = fail_second
+            _process(monitor, path)
+            assert len(sent) == 2
+            assert _state(monitor)["offset"] == len(_line(1) + _line(2))
+            assert _state(monitor)["entries"] == 2
+
+            monitor._send_transcript_entries = send
+            _process(monitor, path)
+            assert len(sent) == 5
+            assert _state(monitor)["entries"] == 5
+            assert _state(monitor)["offset"] == path.stat().st_size
+        finally:
+            transcript_monitor.XADD_BATCH_SIZE = original_batch_size
+
+
+def test_non_object_lines_are_skipped():
+    """Valid JSON lines that aren't objects don't break the batch."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = Path(tmpdir) / "t.jsonl"
+        monitor, sent = _make_monitor()
+
+        _append(path, _line(1) + "[1, 2]\n" + "not json\n" + _line(2))
+        _process(monitor, path)
+        assert len(sent) == 2
+        assert _state(monitor)["offset"] == path.stat().st_size
+        assert _state(monitor)["entries"] == 2
+
+
+if __name__ == '__main__':
+    test_incremental_reads()
+    test_partial_line_waits_for_newline()
+    test_rewritten_transcript_is_reread()
+    test_failed_send_does_not_advance()
+    test_failed_later_batch_keeps_earlier_progress()
+    test_non_object_lines_are_skipped()
+    print("✅ All tests passed!")